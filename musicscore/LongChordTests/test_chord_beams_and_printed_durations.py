@@ -1,6 +1,6 @@
 from musicscore import Chord, QuarterDuration, Part
 from unittest import TestCase
-from musicscore.tests.util_subdivisions import generate_all_subdivision_patterns
+from musicscore.profiler.subdivisions import generate_all_subdivision_patterns
 
 
 class TestBeamsAndPrintedDurations(TestCase):
@@ -5,7 +5,7 @@ from pathlib import Path
 from musicscore import QuarterDurationIsNotWritable, Part, QuarterDuration, Chord, Score
 from musicscore.exceptions import ChordTestError
 from musicscore.tests.util import create_test_xml_paths
-from musicscore.tests.util_subdivisions import generate_subdivsion_test_patterns
+from musicscore.profiler.subdivisions import generate_subdivsion_test_patterns
 
 path = Path(__file__)
 
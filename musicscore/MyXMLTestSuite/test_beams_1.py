@@ -6,7 +6,7 @@ from musicscore.chord import Chord
 from musicscore.part import Part
 from musicscore.score import Score
 from unittest import TestCase
-from musicscore.tests.util_subdivisions import (
+from musicscore.profiler.subdivisions import (
     generate_all_16ths_manually,
     generate_all_32nds_manually,
 )
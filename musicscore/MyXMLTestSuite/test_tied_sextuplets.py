@@ -3,7 +3,7 @@ from pathlib import Path
 from musicscore.chord import Chord
 from musicscore.score import Score
 from musicscore.tests.util import XMLTestCase
-from musicscore.tests.util_subdivisions import generate_all_subdivision_patterns
+from musicscore.profiler.subdivisions import generate_all_subdivision_patterns
 
 path = Path(__file__)
 
@@ -7,7 +7,7 @@ from musicscore.chord import Chord
 from musicscore.part import Part
 from musicscore.score import Score
 from musicscore.tests.util import create_test_xml_paths
-from musicscore.tests.util_subdivisions import generate_all_subdivision_patterns
+from musicscore.profiler.subdivisions import generate_all_subdivision_patterns
 
 path = Path(__file__)
 
@@ -4,7 +4,7 @@ from unittest import TestCase
 from musicscore import Time
 from musicscore.chord import Chord
 from musicscore.score import Score
-from musicscore.tests.util_subdivisions import (
+from musicscore.profiler.subdivisions import (
     generate_all_quintuplets_manually,
     generate_all_triplets_manually,
 )
@@ -1,6 +1,7 @@
 from musicscore.accidental import *
 from musicscore.beat import *
 from musicscore.chord import *
+from musicscore.chordtable import *
 from musicscore.clef import *
 from musicscore.musictree import *
 from musicscore.dynamics import *
@@ -18,3 +19,4 @@ from musicscore.staff import *
 from musicscore.time import *
 from musicscore.voice import *
 from musicscore.simpleformat import *
+from musicscore.xmlimport import *
@@ -196,6 +196,63 @@ SIGNS = {
     2: "double-sharp",
 }
 
+# Pitch spellings (step, alter, octave offset) of each accidental mode indexed by quarter tone class.
+_SPELLINGS = {
+    mode: tuple(table[quarter_tone_class / 2] for quarter_tone_class in range(24))
+    for mode, table in [
+        ("standard", STANDARD),
+        ("enharmonic", ENHARMONIC),
+        ("flat", FLAT),
+        ("sharp", SHARP),
+        ("force-flat", FORCEFLAT),
+        ("force-sharp", FORCESHARP),
+    ]
+}
+
+# Alter values of accidental signs accepted by musicscore.midi.get_accidental_mode()
+_SIGN_ALTERS = {
+    None: 0,
+    "natural": 0,
+    "quarter-sharp": 0.5,
+    "sharp": 1,
+    "#": 1,
+    "s": 1,
+    "three-quarters-sharp": 1.5,
+    "double-sharp": 2,
+    "sharp-sharp": 2,
+    "x": 2,
+    "##": 2,
+    "ss": 2,
+    "quarter-flat": -0.5,
+    "flat": -1,
+    "b": -1,
+    "f": -1,
+    "three-quarters-flat": -1.5,
+    "double-flat": -2,
+    "flat-flat": -2,
+    "bb": -2,
+    "ff": -2,
+}
+
+
+def _get_accidental_modes():
+    # First accidental mode (in order of _SPELLINGS) which spells a quarter tone class with an alter value.
+    output = {}
+    for mode, spellings in _SPELLINGS.items():
+        for quarter_tone_class, (_, alter, _) in enumerate(spellings):
+            output.setdefault((quarter_tone_class, alter), mode)
+    return output
+
+
+_ACCIDENTAL_MODES = _get_accidental_modes()
+
+
+def _get_quarter_tone_class(midi_value):
+    quarter_tones = midi_value * 2
+    if quarter_tones != int(quarter_tones):
+        raise KeyError(midi_value % 12)
+    return int(quarter_tones) % 24
+
 
 class Accidental(MusicTree, XMLWrapper):
     """
@@ -214,7 +271,7 @@ class Accidental(MusicTree, XMLWrapper):
 
     def __init__(self, mode="standard", show: Optional[bool] = None, **kwargs):
         super().__init__()
-        self._xml_object = self.XMLClass(value_="natural", **kwargs)
+        self._xml_object = self.XMLClass(value_="natural", **kwargs) if kwargs else None
         self._mode = None
         self._show = None
         self.show = show
@@ -228,8 +285,12 @@ class Accidental(MusicTree, XMLWrapper):
         if self.parent_midi and self.parent_midi.value != 0:
             self.parent_midi._update_pitch_parameters()
 
+    def _create_xml_object(self):
+        self._xml_object = self.XMLClass(value_="natural")
+        self._update_xml_object()
+
     def _update_xml_object(self):
-        if self.sign:
+        if self._xml_object is not None and self.sign:
             self._xml_object.value_ = self.sign
 
     @XMLWrapper.xml_object.getter
@@ -243,7 +304,7 @@ class Accidental(MusicTree, XMLWrapper):
         if self.parent_midi and self.parent_midi.value == 0:
             return None
         if self.show is True:
-            return self._xml_object
+            return self._get_xml_object()
         elif self.show is False:
             return None
 
@@ -307,7 +368,12 @@ class Accidental(MusicTree, XMLWrapper):
         ``self.cautionary`` or ``self.bracket`` is set to yes, the accidental is always shown regardless of this
         property
         """
-        if "yes" in [self.parentheses, self.editorial, self.cautionary, self.bracket]:
+        if self._xml_object is not None and "yes" in [
+            self.parentheses,
+            self.editorial,
+            self.cautionary,
+            self.bracket,
+        ]:
             return True
         return self._show
 
@@ -342,27 +408,12 @@ class Accidental(MusicTree, XMLWrapper):
         if midi_value == 0:
             return None
 
-        if self.mode == "standard":
-            output = STANDARD[midi_value % 12]
-
-        elif self.mode == "enharmonic":
-            output = ENHARMONIC[midi_value % 12]
-
-        elif self.mode == "force-sharp":
-            output = FORCESHARP[midi_value % 12]
-
-        elif self.mode == "force-flat":
-            output = FORCEFLAT[midi_value % 12]
-
-        elif self.mode == "flat":
-            output = FLAT[midi_value % 12]
-
-        elif self.mode == "sharp":
-            output = SHARP[midi_value % 12]
-
-        else:
+        try:
+            spellings = _SPELLINGS[self.mode]
+        except KeyError:
             raise ValueError
-        return output[0], output[1], output[2] + (int(midi_value // 12)) - 1
+        step, alter, octave = spellings[_get_quarter_tone_class(midi_value)]
+        return step, alter, octave + int(midi_value // 12) - 1
 
     def __copy__(self):
         return self.__class__(mode=self.mode, show=self.show)
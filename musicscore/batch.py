@@ -0,0 +1,236 @@
+"""
+Renders many short scores to MusicXML files with a pool of worker processes. Each worker imports musicscore once and renders all the
+scores it is given.
+
+A score spec is a dictionary (JSON object) like::
+
+    {
+        "name": "exercise_1",
+        "title": "Exercise 1",
+        "subtitle": "Variation A",
+        "get_quantized": false,
+        "parts": [
+            {
+                "id": "p1",
+                "name": "Violin",
+                "time": [3, 4],
+                "key": -1,
+                "quarter_durations": [1, 0.5, 0.5, 1],
+                "midis": [60, 62, [64, 67], 0]
+            }
+        ]
+    }
+
+Only ``parts`` with ``quarter_durations`` and ``midis`` of each part (see :obj:`~musicscore.simpleformat.SimpleFormat`) are required.
+``time`` can be a signature like ``[3, 4]`` or a flat list of signatures like ``[3, 4, 2, 8]`` (see :obj:`~musicscore.time.Time`).
+``key`` is the number of fifths.
+
+Specs are read either from a directory (one spec per ``*.json`` file, named after the file) or from a JSON-lines file (one spec per
+line, named after its ``name`` or its line number). A spec which is not valid JSON is reported as a failed item and does not stop the
+batch. Names are converted to strings. A name which is not a plain file name (for example ``"../exercise"`` or an absolute path) is
+reported as a failed item, so that no file is written outside the output directory. Duplicate names get a numbered suffix
+(``exercise``, ``exercise_2``, ...) so that no output file is overwritten.
+
+Usage::
+
+    python -m musicscore.batch specs/ --output-directory xmls --workers 4
+"""
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from musicscore.key import Key
+from musicscore.score import Score
+from musicscore.simpleformat import SimpleFormat
+
+__all__ = [
+    "BatchResult",
+    "create_score",
+    "read_specs",
+    "render_spec",
+    "render_batch",
+]
+
+
+class BatchResult(NamedTuple):
+    """
+    Result of rendering one score spec. ``error`` is ``None`` if rendering was successful. ``path`` is ``None`` if name is not a
+    valid file name.
+    """
+
+    name: str
+    path: Optional[str]
+    time: float
+    error: Optional[str] = None
+
+
+def create_score(spec: dict) -> Score:
+    """
+    :param spec: score spec (see :obj:`musicscore.batch`)
+    :return: :obj:`~musicscore.score.Score` which is not finalized yet
+    """
+    score = Score(
+        title=spec.get("title"),
+        subtitle=spec.get("subtitle"),
+        get_quantized=spec.get("get_quantized", False),
+    )
+    for index, part_spec in enumerate(spec["parts"], 1):
+        part = score.add_part(part_spec.get("id", f"p{index}"))
+        if part_spec.get("name") is not None:
+            part.name = part_spec["name"]
+        time_signature = part_spec.get("time")
+        measure = part.add_measure(time_signature)
+        if part_spec.get("key") is not None:
+            measure.key = Key(fifths=part_spec["key"])
+        simple_format = SimpleFormat(
+            quarter_durations=part_spec["quarter_durations"],
+            midis=part_spec["midis"],
+        )
+        part.add_chords(simple_format.chords)
+    return score
+
+
+def render_spec(
+    name: str, spec: Union[dict, str], output_directory: str
+) -> BatchResult:
+    """
+    Creates and exports a score. Exceptions are not raised but reported in the result.
+
+    :param name: name of the output file without suffix. It must be a file name without directories.
+    :param spec: score spec (see :obj:`musicscore.batch`) or its JSON string
+    :param output_directory: directory of output file
+    :return: :obj:`BatchResult`
+    """
+    path = None
+    start = time.perf_counter()
+    try:
+        if (
+            not isinstance(name, str)
+            or name in ["", ".", ".."]
+            or Path(name).name != name
+        ):
+            raise ValueError(f"name {name!r} is not a file name.")
+        path = str(Path(output_directory) / f"{name}.xml")
+        if isinstance(spec, str):
+            spec = json.loads(spec)
+        create_score(spec).export_xml(path)
+        error = None
+    except Exception as err:
+        error = f"{err.__class__.__name__}: {err}"
+    return BatchResult(name, path, time.perf_counter() - start, error)
+
+
+def _render_spec(args):
+    return render_spec(*args)
+
+
+def _get_unique_names(names):
+    unique_names = []
+    used_names = set(names)
+    seen_names = set()
+    for name in names:
+        unique_name = name
+        if name in seen_names:
+            number = 2
+            while f"{name}_{number}" in used_names:
+                number += 1
+            unique_name = f"{name}_{number}"
+            used_names.add(unique_name)
+        seen_names.add(name)
+        unique_names.append(unique_name)
+    return unique_names
+
+
+def read_specs(path: "pathlib.Path") -> Iterator[Tuple[str, Union[dict, str]]]:
+    """
+    :param path: directory of ``*.json`` files or a JSON-lines file
+    :return: generator of (name, spec) tuples. If a spec is not valid JSON its text is returned instead, so that
+             :obj:`render_spec` can report the error.
+    """
+    path = Path(path)
+    if path.is_dir():
+        for spec_path in sorted(path.glob("*.json")):
+            with open(spec_path) as f:
+                text = f.read()
+            try:
+                yield spec_path.stem, json.loads(text)
+            except ValueError:
+                yield spec_path.stem, text
+    else:
+        with open(path) as f:
+            for line_number, line in enumerate(f, 1):
+                if line.strip():
+                    name = f"{path.stem}_{line_number}"
+                    try:
+                        spec = json.loads(line)
+                    except ValueError:
+                        yield name, line
+                    else:
+                        if isinstance(spec, dict):
+                            name = spec.get("name", name)
+                        yield name, spec
+
+
+def render_batch(
+    specs: List[Tuple[str, Union[dict, str]]],
+    output_directory: "pathlib.Path",
+    workers: Optional[int] = None,
+) -> List[BatchResult]:
+    """
+    Renders score specs in a pool of ``workers`` processes. Processes are reused for all specs. Workers are spawned and do not
+    inherit the state of the calling process.
+
+    :param specs: list of (name, spec) tuples (see :obj:`read_specs`). Names are converted to strings. Duplicate names get a numbered
+                  suffix.
+    :param output_directory: directory of output files. It is created if it does not exist.
+    :param workers: number of worker processes. If ``None`` the number of CPUs is used. If ``1`` specs are rendered in the calling
+                    process.
+    :return: list of :obj:`BatchResult` in order of specs
+    """
+    os.makedirs(output_directory, exist_ok=True)
+    names = _get_unique_names([str(name) for name, _ in specs])
+    tasks = [
+        (name, spec, str(output_directory)) for name, (_, spec) in zip(names, specs)
+    ]
+    if workers == 1 or len(tasks) < 2:
+        return [_render_spec(task) for task in tasks]
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=get_context("spawn")
+    ) as executor:
+        return list(executor.map(_render_spec, tasks, chunksize=8))
+
+
+def _get_summary(results, total_time):
+    lines = []
+    for result in results:
+        status = "ok" if result.error is None else f"FAILED {result.error}"
+        lines.append(f"{result.name}: {result.time:.3f}s {status}")
+    number_of_failures = len([result for result in results if result.error])
+    lines.append(
+        f"{len(results) - number_of_failures} rendered, {number_of_failures} failed in {total_time:.3f}s"
+    )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="musicscore.batch")
+    parser.add_argument("specs", help="directory of *.json files or a JSON-lines file")
+    parser.add_argument("-o", "--output-directory", default=".")
+    parser.add_argument("-w", "--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+    start = time.perf_counter()
+    results = render_batch(
+        list(read_specs(args.specs)), args.output_directory, args.workers
+    )
+    print(_get_summary(results, time.perf_counter() - start))
+    return 1 if any(result.error for result in results) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
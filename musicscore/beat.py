@@ -1,10 +1,17 @@
+from functools import lru_cache
 from itertools import accumulate
 from typing import List
 
 from math import trunc
 from fractions import Fraction
 
-from musicscore.chord import _split_copy, _group_chords, Chord, _update_split_lyrics
+from musicscore.chord import (
+    _split_copy,
+    _group_chords,
+    _get_chord_group_sizes,
+    Chord,
+    _update_split_lyrics,
+)
 from musicscore.config import SPLITTABLES, GENERALSPLITTABLES, SPLITTEXCEPTIONS
 from musicscore.exceptions import (
     BeatWrongDurationError,
@@ -19,14 +26,22 @@ from musicscore.exceptions import (
     BeatUpdateChordTupletsError,
     ChordTypeNotSetError,
 )
-from musicscore.finalize import FinalizeMixin
+from musicscore.finalize import FinalizeMixin, _finalize_phase
 from musicscore.musictree import MusicTree
-from musicscore.quantize import QuantizeMixin
+from musicscore.quantize import QuantizeMixin, _resolving_settings
 from musicscore.quarterduration import QuarterDuration, QuarterDurationMixin
 from musicscore.tuplet import SimplifiedSextuplets, Tuplet
 from musicscore.util import lcm, split_list
 
-__all__ = ["Beat", "beam_chord_group", "get_chord_group_subdivision"]
+__all__ = [
+    "Beat",
+    "beam_chord_group",
+    "get_chord_group_subdivision",
+    "get_split_cache_info",
+    "clear_split_cache",
+    "get_pattern_cache_info",
+    "clear_pattern_cache",
+]
 
 
 def _convert_to_quarter_duration_splittables_dictionary(simple_splittalbes):
@@ -44,6 +59,90 @@ _SPLITTABLE_QUARTER_DURATIONS = _convert_to_quarter_duration_splittables_diction
 )
 
 
+#: Maximum number of (beat quarter duration, offset, quarter duration, simplified sextuplets) combinations whose split is kept.
+SPLIT_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=SPLIT_CACHE_SIZE)
+def _get_split_quarter_durations(
+    beat_quarter_duration, offset, quarter_duration, simplified_sextuplets
+):
+    # Splits which do not depend on the subdivision of the beat. Results are tuples of Fractions and can be shared between chords.
+    if simplified_sextuplets and beat_quarter_duration == 1:
+        if offset == Fraction(1, 6) and quarter_duration == Fraction(5, 6):
+            return Fraction(1, 6), Fraction(4, 6)
+        if offset == 0 and quarter_duration == Fraction(5, 6):
+            return Fraction(4, 6), Fraction(1, 6)
+
+    quarter_durations = _SPLITTABLE_QUARTER_DURATIONS.get(offset, {}).get(
+        quarter_duration
+    )
+    if quarter_durations:
+        return tuple(qd.value for qd in quarter_durations)
+
+    numerators = GENERALSPLITTABLES.get(quarter_duration.numerator)
+    if numerators:
+        return tuple(Fraction(x, quarter_duration.denominator) for x in numerators)
+    return None
+
+
+@lru_cache(maxsize=SPLIT_CACHE_SIZE)
+def _get_split_exception_quarter_durations(
+    beat_quarter_duration, subdivision, quarter_duration
+):
+    split_qds = (
+        SPLITTEXCEPTIONS.get(beat_quarter_duration, {})
+        .get(subdivision, {})
+        .get(quarter_duration.as_integer_ratio())
+    )
+    if split_qds:
+        return tuple(Fraction(*qd) for qd in split_qds)
+    return None
+
+
+def get_pattern_cache_info():
+    """
+    :return: statistics (hits, misses, maxsize, currsize) of the caches which are used by :obj:`~musicscore.beat.Beat` to set
+             subdivisions, groupings and beams of rhythmic patterns: ``{"subdivisions": ..., "groups": ..., "beams": ...}``
+    :rtype: dict
+    """
+    return {
+        "subdivisions": _get_subdivision.cache_info(),
+        "groups": _get_chord_group_sizes.cache_info(),
+        "beams": _get_beams.cache_info(),
+    }
+
+
+def clear_pattern_cache():
+    """
+    Clears the caches of subdivisions, groupings and beams of rhythmic patterns.
+    """
+    _get_subdivision.cache_clear()
+    _get_chord_group_sizes.cache_clear()
+    _get_beams.cache_clear()
+
+
+def get_split_cache_info():
+    """
+    :return: statistics (hits, misses, maxsize, currsize) of the caches which are used by :obj:`~musicscore.beat.Beat` to decide how
+             unwritable chords are split: ``{"splittables": ..., "split_exceptions": ...}``
+    :rtype: dict
+    """
+    return {
+        "splittables": _get_split_quarter_durations.cache_info(),
+        "split_exceptions": _get_split_exception_quarter_durations.cache_info(),
+    }
+
+
+def clear_split_cache():
+    """
+    Clears the caches of split decisions. It must be called if :obj:`~musicscore.config.GENERALSPLITTABLES` or
+    :obj:`~musicscore.config.SPLITTEXCEPTIONS` are changed during runtime.
+    """
+    _get_split_quarter_durations.cache_clear()
+    _get_split_exception_quarter_durations.cache_clear()
+
+
 def _find_nearest_quantized_value(quantized_values, values):
     output = []
     for value in values:
@@ -55,8 +154,26 @@ def _find_nearest_quantized_value(quantized_values, values):
     return output
 
 
-def _find_q_delta(quantized_locations, values):
-    qs = _find_nearest_quantized_value(quantized_locations, values)
+def _find_nearest_quantized_value_windowed(duration, subdivision, values):
+    # Only the two grid points surrounding each value are compared. QuarterDuration arithmetic rounds to a denominator of at most 1000,
+    # so farther grid points can only be excluded safely if the grid step is larger than twice this rounding error.
+    fr = duration / subdivision
+    if fr != Fraction(duration) / subdivision or fr * 500 <= 1:
+        return _find_nearest_quantized_value(
+            _find_quantized_locations(duration, subdivision), values
+        )
+    output = []
+    for value in values:
+        index = trunc(Fraction(value) / Fraction(fr))
+        nearest_quantized = min(
+            [x * fr for x in (index, index + 1) if x <= subdivision],
+            key=lambda q: abs(q - value),
+        )
+        output.append((nearest_quantized, nearest_quantized - value))
+    return output
+
+
+def _sum_q_deltas(qs):
     d = 0
     for q in qs:
         d += abs(q[1])
@@ -70,8 +187,19 @@ def _find_quantized_locations(duration, subdivision):
     return output
 
 
+#: Maximum number of rhythmic signatures of chord groups whose subdivision or beams are kept.
+PATTERN_CACHE_SIZE = 1024
+
+
 def get_chord_group_subdivision(chords):
-    qds = [ch.quarter_duration for ch in chords if ch.quarter_duration != 0]
+    return _get_subdivision(
+        tuple(ch.quarter_duration.value for ch in chords if ch.quarter_duration != 0)
+    )
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def _get_subdivision(quarter_duration_values):
+    qds = [QuarterDuration(value) for value in quarter_duration_values]
     if len(qds) == 1:
         return qds[0].denominator
     qd_sum = sum(qds)
@@ -109,7 +237,39 @@ def beam_chord_group(chord_group: List["Chord"]) -> None:
             raise ChordTypeNotSetError(
                 "Beaming chord groups not possible if chord types are not set."
             )
+    if all(ch.beams == {} for ch in chord_group):
+        # Without manually set beams the result only depends on the rhythmic signature of the group.
+        pattern = _get_beams(
+            tuple((ch.number_of_beams, ch.is_rest) for ch in chord_group)
+        )
+        for ch, beams in zip(chord_group, pattern):
+            for number, value in beams:
+                ch.set_beam(number, value)
+    else:
+        _beam_chords(chord_group)
+
 
+class _BeamedChordSignature:
+    # Stands in for a chord without beams in _beam_chords()
+    __slots__ = ("number_of_beams", "is_rest", "beams")
+
+    def __init__(self, number_of_beams, is_rest):
+        self.number_of_beams = number_of_beams
+        self.is_rest = is_rest
+        self.beams = {}
+
+    def set_beam(self, number, value):
+        self.beams[number] = value
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def _get_beams(signature):
+    chords = [_BeamedChordSignature(*item) for item in signature]
+    _beam_chords(chords)
+    return tuple(tuple(ch.beams.items()) for ch in chords)
+
+
+def _beam_chords(chord_group):
     def remove_rests_from_both_ends(chords):
         is_rest_list = [ch.is_rest for ch in chords]
         if False not in is_rest_list:
@@ -314,6 +474,7 @@ class Beat(
     def _add_child(self, child):
         child._parent = self
         self._children.append(child)
+        self._reset_iterators()
         try:
             self.up.up.up.up.set_current_measure(
                 staff_number=self.up.up.number,
@@ -358,17 +519,22 @@ class Beat(
                 output.append(output[i] + qd)
             return output
 
+        def _find_nearest(subdivision):
+            if self.quantization_engine == "windowed":
+                return _find_nearest_quantized_value_windowed(
+                    self.quarter_duration, subdivision, positions
+                )
+            return _find_nearest_quantized_value(
+                self._get_quantized_locations(subdivision=subdivision), positions
+            )
+
         positions = _get_positions()
         permitted_divs = self.get_possible_subdivisions()[:]
         best_div = permitted_divs.pop(0)
-        last_q_delta = _find_q_delta(
-            self._get_quantized_locations(subdivision=best_div), positions
-        )
+        last_q_delta = _sum_q_deltas(_find_nearest(best_div))
 
         for div in permitted_divs:
-            current_q_delta = _find_q_delta(
-                self._get_quantized_locations(subdivision=div), positions
-            )
+            current_q_delta = _sum_q_deltas(_find_nearest(div))
 
             if current_q_delta < last_q_delta:
                 best_div = div
@@ -377,12 +543,7 @@ class Beat(
             elif (current_q_delta == last_q_delta) and (div < best_div):
                 best_div = div
 
-        quantized_positions = [
-            f[0]
-            for f in _find_nearest_quantized_value(
-                self._get_quantized_locations(subdivision=best_div), positions
-            )
-        ]
+        quantized_positions = [f[0] for f in _find_nearest(best_div)]
 
         quantized_durations = []
 
@@ -413,53 +574,30 @@ class Beat(
         for midi in chord.midis:
             starting_ties.append(True if midi.is_tied_to_next else False)
 
-        def _get_quarter_durations():
-            if self.simplified_sextuplets and self.quarter_duration == 1:
-                if offset == 1 / 6 and chord.quarter_duration == 5 / 6:
-                    return [QuarterDuration(1, 6), QuarterDuration(4, 6)]
-                if offset == 0 and chord.quarter_duration == 5 / 6:
-                    return [QuarterDuration(4, 6), QuarterDuration(1, 6)]
-
-            if _SPLITTABLE_QUARTER_DURATIONS.get(
-                offset
-            ) and _SPLITTABLE_QUARTER_DURATIONS.get(offset).get(chord.quarter_duration):
-                quarter_durations = _SPLITTABLE_QUARTER_DURATIONS.get(offset).get(
-                    chord.quarter_duration
-                )
-                if quarter_durations:
-                    return [QuarterDuration(qd) for qd in quarter_durations]
-
-            if GENERALSPLITTABLES.get(chord.quarter_duration.numerator):
-                quarter_durations = [
-                    QuarterDuration(x, chord.quarter_duration.denominator)
-                    for x in GENERALSPLITTABLES.get(chord.quarter_duration.numerator)
-                ]
-                return quarter_durations
-
-            try:
-                split_qds = (
-                    SPLITTEXCEPTIONS.get(self.quarter_duration.value)
-                    .get(self.get_subdivision())
-                    .get(chord.quarter_duration.as_integer_ratio())
-                )
-                if split_qds:
-                    quarter_durations = [
-                        QuarterDuration(qd[0], qd[1]) for qd in split_qds
-                    ]
-                    return quarter_durations
-            except AttributeError:
-                return None
-
-        quarter_durations = _get_quarter_durations()
+        beat_quarter_duration = self.quarter_duration.value
+        quarter_duration = chord.quarter_duration.value
+        quarter_durations = _get_split_quarter_durations(
+            beat_quarter_duration,
+            getattr(offset, "value", offset),
+            quarter_duration,
+            bool(self.simplified_sextuplets),
+        )
+        if not quarter_durations and beat_quarter_duration in SPLITTEXCEPTIONS:
+            quarter_durations = _get_split_exception_quarter_durations(
+                beat_quarter_duration, self.get_subdivision(), quarter_duration
+            )
         if not quarter_durations:
             return [chord]
-        output = self._split_chord(chord, quarter_durations)
+        output = self._split_chord(
+            chord, [QuarterDuration(qd) for qd in quarter_durations]
+        )
         for midi, tied in zip(output[-1].midis, starting_ties):
             if tied is True:
                 midi.add_tie("start")
         _update_split_lyrics(output)
         return output
 
+    @_finalize_phase("types_and_dots")
     def _update_chord_types(self):
         for ch in self.get_chords():
             if not ch.type:
@@ -472,6 +610,7 @@ class Beat(
                         f"Chord {ch.get_position_in_tree()} with offset {ch.offset}: {err} Consider setting type, number_of_dots and tuplet properties of the chord manually or splitting it into writable chords."
                     )
 
+    @_finalize_phase("types_and_dots")
     def _update_chord_number_of_dots(self):
         for ch in self.get_chords():
             if ch.number_of_dots is None:
@@ -479,6 +618,7 @@ class Beat(
                     ch.quarter_duration.beat_subdivision = self.get_subdivision()
                 ch.number_of_dots = ch.quarter_duration.get_number_of_dots()
 
+    @_finalize_phase("tuplets")
     def _update_chord_tuplets(self):
         non_grace_chords = [
             chord for chord in self.get_chords() if chord.quarter_duration != 0
@@ -557,6 +697,7 @@ class Beat(
 
         _update_tuplets(non_grace_chords, actual_notes, self.quarter_duration)
 
+    @_finalize_phase("beams")
     def _update_chord_beams(self):
         chords = [ch for ch in self.get_chords() if ch.quarter_duration != 0]
         if chords:
@@ -689,6 +830,7 @@ class Beat(
             else:
                 pass
 
+    @_finalize_phase("split_unwritable_chords")
     def _split_unwritable_chords(self) -> None:
         """
         This method checks if the quarter duration of all children chords must be split according to :obj:`~musicscore.beat.SPLITTABLES`
@@ -713,6 +855,7 @@ class Beat(
                         + split
                         + self.get_children()[index + 1 :]
                     )
+                self._reset_iterators()
 
     @property
     def is_filled(self) -> bool:
@@ -830,6 +973,8 @@ class Beat(
                 )
             )
 
+    @_finalize_phase("finalize")
+    @_resolving_settings
     def finalize(self):
         """
         finalize can only be called once.
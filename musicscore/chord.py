@@ -1,6 +1,7 @@
 import copy
 import warnings
 from fractions import Fraction
+from functools import lru_cache
 from typing import Union, List, Optional, Any, Dict
 
 from musicscore.clef import Clef
@@ -28,10 +29,11 @@ from musicscore.exceptions import (
     ChordNumberOfDotsNotSetError,
     ChordParentBeamError,
 )
-from musicscore.finalize import FinalizeMixin
+from musicscore.finalize import FinalizeMixin, _finalize_phase
 from musicscore.midi import Midi
 from musicscore.musictree import MusicTree
 from musicscore.note import Note
+from musicscore.quantize import _resolving_settings
 from musicscore.quarterduration import QuarterDuration, QuarterDurationMixin
 from musicscore.tuplet import Tuplet
 from musicscore.util import (
@@ -452,6 +454,7 @@ class Chord(MusicTree, QuarterDurationMixin, FinalizeMixin):
             _update_split_lyrics(output)
         return output
 
+    @_finalize_phase("notes")
     def _update_notes(self):
         if self._notes_are_set:
             raise ChordAlreadyHasNotesError("updating notes not possible.")
@@ -1417,6 +1420,8 @@ class Chord(MusicTree, QuarterDurationMixin, FinalizeMixin):
                 f"printed duration {printed_duration} != quarter duration {self.quarter_duration}"
             )
 
+    @_finalize_phase("finalize")
+    @_resolving_settings
     def finalize(self):
         """
         Finalize can be called only once. All necessary updates and xmlelement object creations will take place and the MusicTree
@@ -1629,7 +1634,7 @@ class Chord(MusicTree, QuarterDurationMixin, FinalizeMixin):
     def __setattr__(self, key, value):
         if (
             key[0] != "_"
-            and key not in self._ATTRIBUTES.union(self._TREE_ATTRIBUTES)
+            and key not in self._LOCAL_ATTRIBUTES
             and key not in self.__dict__
         ):
             if self.notes:
@@ -1915,51 +1920,62 @@ def _split_copy(
     return new_chord
 
 
-def _split_last_grace_chords(chords):
-    output = [[], []]
-    for chord in chords:
-        if chord.quarter_duration == 0:
-            output[1].append(chord)
-        else:
-            output[0] += output[1]
-            output[1] = []
-            output[0].append(chord)
-    return output
+#: Children of a lyric which are kept in its extension lyrics (see :obj:`_update_split_lyrics`)
+_LYRIC_EXTENSION_CHILDREN = (XMLEndLine, XMLEndParagraph, XMLFootnote, XMLLevel)
 
 
-def _update_split_lyrics(chords):
-    def _create_new_lyrics(old_lyrics, extend_type):
-        new_lyrics = copy.deepcopy(old_lyrics)
-        new_lyrics.xml_syllabic = None
-        new_lyrics.xml_text = None
-        if new_lyrics.xml_extend:
-            new_lyrics.xml_extend.type = extend_type
-        else:
-            new_lyrics.xml_extend = XMLExtend(type=extend_type)
-        new_lyrics.xsd_check = False
-        return new_lyrics
+class _LyricExtension:
+    """
+    Lightweight record of what extension lyrics of split chords take over from the lyric of the first chord: its attributes, the
+    attributes of its extend element and its children after the extend element. Extension lyrics are created from this record
+    instead of deepcopying the whole lyric and removing its text and syllabic afterwards.
+    """
+
+    __slots__ = ("attributes", "extend_attributes", "children")
+
+    def __init__(self, lyric: XMLLyric):
+        self.attributes = dict(lyric.attributes)
+        self.extend_attributes = (
+            {k: v for k, v in lyric.xml_extend.attributes.items() if k != "type"}
+            if lyric.xml_extend
+            else {}
+        )
+        self.children = [
+            child
+            for child in lyric.get_children(ordered=False)
+            if isinstance(child, _LYRIC_EXTENSION_CHILDREN)
+        ]
+
+    def create_lyric(self, extend_type: str) -> XMLLyric:
+        # The extension lyric has no text and is not xsd checked (as before), so its children need not be ordered by a child
+        # container: extend is added first.
+        lyric = XMLLyric(xsd_check=False, **self.attributes)
+        lyric.add_child(XMLExtend(type=extend_type, **self.extend_attributes))
+        for child in self.children:
+            lyric.add_child(copy.deepcopy(child))
+        return lyric
+
 
+def _update_split_lyrics(chords):
     if len(chords) > 1:
         for l in chords[0].xml_lyrics:
             if l.xml_extend:
                 if l.xml_extend.type in ["start", "continue"]:
+                    extension = _LyricExtension(l)
                     for chord in chords[1:]:
-                        new_lyrics = _create_new_lyrics(l, "continue")
-                        chord.add_lyric(new_lyrics)
+                        chord.add_lyric(extension.create_lyric("continue"))
                 else:
                     l.xml_extend.type = "continue"
+                    extension = _LyricExtension(l)
                     for chord in chords[1:-1]:
-                        new_lyrics = _create_new_lyrics(l, "continue")
-                        chord.add_lyric(new_lyrics)
-                    new_lyrics = _create_new_lyrics(l, "stop")
-                    chords[-1].add_lyric(new_lyrics)
+                        chord.add_lyric(extension.create_lyric("continue"))
+                    chords[-1].add_lyric(extension.create_lyric("stop"))
             elif l.xml_syllabic and l.xml_syllabic.value_ in ["single", "end"]:
                 l.xml_extend = XMLExtend(type="start")
+                extension = _LyricExtension(l)
                 for chord in chords[1:-1]:
-                    new_lyrics = _create_new_lyrics(l, "continue")
-                    chord.add_lyric(new_lyrics)
-                new_lyrics = _create_new_lyrics(l, "stop")
-                chords[-1].add_lyric(new_lyrics)
+                    chord.add_lyric(extension.create_lyric("continue"))
+                chords[-1].add_lyric(extension.create_lyric("stop"))
 
 
 def _group_chords(
@@ -1973,28 +1989,58 @@ def _group_chords(
     :param quarter_durations:
     :return: Optional[List[List[:obj:`Chord`]]]
     """
-    if sum(c.quarter_duration for c in chords) != sum(quarter_durations):
+    # QuarterDurations are mutable and cannot be cache keys: use their Fraction values.
+    group_sizes = _get_chord_group_sizes(
+        tuple(c.quarter_duration.value for c in chords),
+        tuple(QuarterDuration(qd).value for qd in quarter_durations),
+    )
+    if group_sizes is None:
+        return None
+    output = []
+    start = 0
+    for size in group_sizes:
+        output.append(chords[start : start + size])
+        start += size
+    return output
+
+
+#: Maximum number of (chord quarter durations, group quarter durations) combinations whose grouping is kept.
+CHORD_GROUPS_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=CHORD_GROUPS_CACHE_SIZE)
+def _get_chord_group_sizes(chord_quarter_duration_values, quarter_durations):
+    chord_quarter_durations = [
+        QuarterDuration(value) for value in chord_quarter_duration_values
+    ]
+    if sum(chord_quarter_durations) != sum(quarter_durations):
         raise ValueError(
-            f"chords quarter durations ({[c.quarter_duration for c in chords]}) and arg quarter_duration {quarter_durations} does not match."
+            f"chords quarter durations ({chord_quarter_durations}) and arg quarter_duration {list(quarter_durations)} does not match."
         )
-    output = []
-    for _ in quarter_durations:
-        output.append([])
+    number_of_groupable_chords = len(chord_quarter_durations)
+    # Grace chords at the end are added to the last group.
+    while (
+        number_of_groupable_chords
+        and chord_quarter_durations[number_of_groupable_chords - 1] == 0
+    ):
+        number_of_groupable_chords -= 1
+    output = [0 for _ in quarter_durations]
     index = 0
     current_quarter_duration = quarter_durations[0]
-    groupable_chords, last_grace_chords = _split_last_grace_chords(chords)
-    for ch in groupable_chords:
-        output[index].append(ch)
-        current_sum = sum(c.quarter_duration for c in output[index])
+    current_sum = 0
+    for qd in chord_quarter_durations[:number_of_groupable_chords]:
+        output[index] += 1
+        current_sum += qd
         if current_sum < current_quarter_duration:
             pass
         elif current_sum == current_quarter_duration:
             index += 1
+            current_sum = 0
             if index == len(quarter_durations):
                 pass
             else:
                 current_quarter_duration = quarter_durations[index]
         else:
             return None
-    output[-1] += last_grace_chords
-    return output
+    output[-1] += len(chord_quarter_durations) - number_of_groupable_chords
+    return tuple(output)
@@ -0,0 +1,125 @@
+import numbers
+from typing import Iterator, Optional, Sequence
+
+from musicscore.chord import Chord
+from musicscore.quarterduration import QuarterDuration
+
+__all__ = ["ChordTable"]
+
+
+def _to_number(value):
+    # Converts scalars of array libraries (for example numpy.int64) to python numbers. Other real numbers (int, float, Fraction,
+    # QuarterDuration ...) are kept.
+    if hasattr(value, "item"):
+        return value.item()
+    if isinstance(value, numbers.Real):
+        return value
+    raise TypeError(f"{value} is not a number.")
+
+
+def _to_midis(value):
+    if hasattr(value, "tolist"):
+        value = value.tolist()
+    if isinstance(value, (list, tuple)):
+        return [_to_number(midi) for midi in value]
+    return _to_number(value)
+
+
+def _create_tied_chord(midis, quarter_duration):
+    # Creates a following section of a row which does not fit into the current beat. It is tied to the previous section by the caller.
+    chord = Chord(midis, quarter_duration)
+    for midi in chord.midis:
+        midi.accidental.show = False
+    return chord
+
+
+class ChordTable:
+    """
+    ChordTable holds chord data column-wise: one entry per chord in each column. Columns can be lists, tuples or one-dimensional arrays
+    (for example numpy arrays). They are kept as they are given and are only read row by row. When the table is added to a part via
+    :obj:`~musicscore.part.Part.add_chord_table()`, measures, beats and the beatwise sections of each row are computed from the
+    columns, and a :obj:`~musicscore.chord.Chord` is created only when a section is placed in a beat. Chords of long rows are
+    therefore not created first and split afterwards. Once added, the chords are ordinary chords of the part.
+
+    :param quarter_durations: quarter duration of each chord (int, float, Fraction, :obj:`~musicscore.quarterduration.QuarterDuration`
+                              or a scalar of an array)
+    :param midis: midi value or a sequence of midi values of each chord (0 for a rest)
+    :param dynamics: ``None`` or a dynamics value (str) or ``None`` for each chord
+    :param lyrics: ``None`` or a lyric text or ``None`` for each chord
+    """
+
+    def __init__(
+        self,
+        quarter_durations: Sequence,
+        midis: Sequence,
+        dynamics: Optional[Sequence] = None,
+        lyrics: Optional[Sequence] = None,
+    ):
+        self._quarter_durations = quarter_durations
+        self._midis = midis
+        self._dynamics = dynamics
+        self._lyrics = lyrics
+        self._check_columns()
+
+    def _check_columns(self):
+        number_of_rows = len(self._quarter_durations)
+        for name in ["midis", "dynamics", "lyrics"]:
+            column = getattr(self, f"_{name}")
+            if column is not None and len(column) != number_of_rows:
+                raise ValueError(
+                    f"ChordTable: {name} has {len(column)} rows instead of {number_of_rows}."
+                )
+        for quarter_duration in self._quarter_durations:
+            if _to_number(quarter_duration) < 0:
+                raise ValueError(
+                    f"ChordTable: wrong quarter duration {quarter_duration}"
+                )
+        for midis in self._midis:
+            _to_midis(midis)
+
+    @property
+    def quarter_durations(self) -> Sequence:
+        return self._quarter_durations
+
+    @property
+    def midis(self) -> Sequence:
+        return self._midis
+
+    @property
+    def dynamics(self) -> Optional[Sequence]:
+        return self._dynamics
+
+    @property
+    def lyrics(self) -> Optional[Sequence]:
+        return self._lyrics
+
+    def _get_row(self, index):
+        return QuarterDuration(_to_number(self._quarter_durations[index])), _to_midis(
+            self._midis[index]
+        )
+
+    def _create_chord(self, index, midis, quarter_duration):
+        chord = Chord(midis, quarter_duration)
+        if self._dynamics is not None and self._dynamics[index] is not None:
+            chord.add_dynamics(self._dynamics[index])
+        if self._lyrics is not None and self._lyrics[index] is not None:
+            chord.add_lyric(self._lyrics[index])
+        return chord
+
+    def get_chord(self, index: int) -> Chord:
+        """
+        :param index: row index
+        :return: a new :obj:`~musicscore.chord.Chord` created from row ``index``
+        """
+        quarter_duration, midis = self._get_row(index)
+        return self._create_chord(index, midis, quarter_duration)
+
+    def iterate_chords(self) -> Iterator[Chord]:
+        """
+        :return: generator of new :obj:`~musicscore.chord.Chord` objects, one per row
+        """
+        for index in range(len(self)):
+            yield self.get_chord(index)
+
+    def __len__(self):
+        return len(self._quarter_durations)
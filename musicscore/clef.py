@@ -7,7 +7,7 @@ __all__ = ["Clef", "TrebleClef", "BassClef", "AltoClef", "TenorClef"]
 
 
 class Clef(XMLWrapper):
-    _ATTRIBUTES = {"show", "sign", "line", "octave_change"}
+    _ATTRIBUTES = {"show", "sign", "line", "octave_change", "number"}
     XMLClass = XMLClef
 
     def __init__(
@@ -21,7 +21,11 @@ class Clef(XMLWrapper):
         **kwargs,
     ):
         super().__init__()
-        self._xml_object = self.XMLClass(*args, **kwargs)
+        self._xml_object = self.XMLClass(*args, **kwargs) if args or kwargs else None
+        self._line = None
+        self._sign = None
+        self._octave_change = None
+        self._number = None
         self._show = None
         self.show = show
         self.line = line
@@ -30,6 +34,13 @@ class Clef(XMLWrapper):
 
         self._default = default
 
+    def _create_xml_object(self):
+        self._xml_object = self.XMLClass()
+        self.xml_object.xml_sign = self._sign
+        self.xml_object.xml_line = self._line
+        self.xml_object.xml_clef_octave_change = self._octave_change
+        self.xml_object.number = self._number
+
     @property
     def line(self) -> Optional[int]:
         """
@@ -38,12 +49,33 @@ class Clef(XMLWrapper):
         :return: ``self.xml_object.xml_line.value_``
         :rtype: int, None
         """
+        if self._xml_object is None:
+            return self._line
         if self.xml_object.xml_line:
             return self.xml_object.xml_line.value_
 
     @line.setter
     def line(self, val):
-        self.xml_object.xml_line = val
+        self._line = val
+        if self._xml_object is not None:
+            self.xml_object.xml_line = val
+
+    @property
+    def number(self) -> Optional[int]:
+        """
+        Set and get ``number`` attribute of associated :obj:`~musicxml.xmlelement.xmlelement.XMLClef`
+
+        :return: ``self.xml_object.number``
+        """
+        if self._xml_object is None:
+            return self._number
+        return self.xml_object.number
+
+    @number.setter
+    def number(self, val):
+        self._number = val
+        if self._xml_object is not None:
+            self.xml_object.number = val
 
     @property
     def octave_change(self) -> Optional[int]:
@@ -53,12 +85,16 @@ class Clef(XMLWrapper):
         :return: ``self.xml_object.xml_clef_octave_change.value_``
         """
 
+        if self._xml_object is None:
+            return self._octave_change
         if self.xml_object.xml_clef_octave_change:
             return self.xml_object.xml_clef_octave_change.value_
 
     @octave_change.setter
     def octave_change(self, val):
-        self.xml_object.xml_clef_octave_change = val
+        self._octave_change = val
+        if self._xml_object is not None:
+            self.xml_object.xml_clef_octave_change = val
 
     @property
     def sign(self) -> Optional[str]:
@@ -68,12 +104,16 @@ class Clef(XMLWrapper):
         :return: ``self.xml_object.xml_sign.value_``
         :rtype: str, None
         """
+        if self._xml_object is None:
+            return self._sign
         if self.xml_object.xml_sign:
             return self.xml_object.xml_sign.value_
 
     @sign.setter
     def sign(self, val):
-        self.xml_object.xml_sign = val
+        self._sign = val
+        if self._xml_object is not None:
+            self.xml_object.xml_sign = val
 
     @property
     def show(self) -> bool:
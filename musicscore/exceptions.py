@@ -139,6 +139,13 @@ class GraceChordCannotSetQuarterDurationError(GraceChordException):
     pass
 
 
+# Import exceptions
+
+
+class XMLImportError(MusicTreeException):
+    pass
+
+
 # Lyrics exceptions
 
 
@@ -248,6 +255,10 @@ class ScoreHasNoPartsError(ScoreException):
     pass
 
 
+class ScoreXMLReleasedError(ScoreException):
+    pass
+
+
 # Staff exceptions
 class StaffException(MusicTreeException):
     pass
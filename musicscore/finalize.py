@@ -1,7 +1,147 @@
+import json
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+
 from musicscore.exceptions import (
     AlreadyFinalizedError,
     ClassHasNoMusicXMLEquivalentError,
 )
+from musicscore.quantize import _resolving_settings
+
+_finalize_report = None
+
+
+class FinalizeReport:
+    """
+    Report of an instrumented finalization (see :obj:`profile_finalize`).
+
+    For each phase and node type the cumulative time in seconds and the number of calls are recorded. Phases are nested (for example
+    ``finalize`` of a :obj:`~musicscore.measure.Measure` includes ``accidentals`` and ``finalize`` of its beats), hence times of different
+    phases must not be summed up.
+    """
+
+    def __init__(self):
+        self._start = perf_counter()
+        self._statistics = {}
+        self._events = []
+        self._running = set()
+
+    def _add(self, phase, node_type, start, duration):
+        statistics = self._statistics.setdefault((phase, node_type), [0.0, 0])
+        statistics[0] += duration
+        statistics[1] += 1
+        self._events.append((phase, node_type, start, duration))
+
+    @property
+    def statistics(self) -> dict:
+        """
+        :return: ``{(phase, node type): {"time": seconds, "calls": number}}``
+        """
+        return {
+            key: {"time": time, "calls": calls}
+            for key, (time, calls) in self._statistics.items()
+        }
+
+    @property
+    def phases(self) -> dict:
+        """
+        :return: ``{phase: {"time": seconds, "calls": number}}`` summed over all node types
+        """
+        output = {}
+        for (phase, _), (time, calls) in self._statistics.items():
+            values = output.setdefault(phase, {"time": 0.0, "calls": 0})
+            values["time"] += time
+            values["calls"] += calls
+        return output
+
+    @property
+    def node_types(self) -> dict:
+        """
+        :return: ``{node type: {phase: {"time": seconds, "calls": number}}}``
+        """
+        output = {}
+        for (phase, node_type), (time, calls) in self._statistics.items():
+            output.setdefault(node_type, {})[phase] = {"time": time, "calls": calls}
+        return output
+
+    def get_chrome_trace(self) -> dict:
+        """
+        :return: recorded calls as complete events of the Chrome trace event format (viewable in ``chrome://tracing`` or Perfetto)
+        """
+        return {
+            "traceEvents": [
+                {
+                    "name": f"{node_type}.{phase}",
+                    "cat": phase,
+                    "ph": "X",
+                    "ts": (start - self._start) * 1e6,
+                    "dur": duration * 1e6,
+                    "pid": 0,
+                    "tid": 0,
+                }
+                for phase, node_type, start, duration in self._events
+            ]
+        }
+
+    def write_chrome_trace(self, path) -> None:
+        with open(path, "w") as f:
+            json.dump(self.get_chrome_trace(), f)
+
+    def __str__(self):
+        lines = [f"{'phase':<28}{'node type':<12}{'calls':>10}{'time [s]':>12}"]
+        for (phase, node_type), (time, calls) in sorted(
+            self._statistics.items(), key=lambda item: -item[1][0]
+        ):
+            lines.append(f"{phase:<28}{node_type:<12}{calls:>10}{time:>12.4f}")
+        return "\n".join(lines)
+
+
+@contextmanager
+def profile_finalize():
+    """
+    Context manager instrumenting all finalization phases called inside it::
+
+        with profile_finalize() as report:
+            score.export_xml(path)
+        print(report)
+
+    :return: :obj:`FinalizeReport`
+    """
+    global _finalize_report
+    previous_report = _finalize_report
+    report = _finalize_report = FinalizeReport()
+    try:
+        yield report
+    finally:
+        _finalize_report = previous_report
+
+
+def _finalize_phase(phase):
+    # Decorator recording calls of a finalization phase if a report is active. Otherwise only one global lookup is added. Calls of
+    # overridden methods via super() are recorded only once.
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            report = _finalize_report
+            if report is None:
+                return method(self, *args, **kwargs)
+            key = (id(self), phase)
+            if key in report._running:
+                return method(self, *args, **kwargs)
+            report._running.add(key)
+            start = perf_counter()
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                report._add(
+                    phase, self.__class__.__name__, start, perf_counter() - start
+                )
+                report._running.discard(key)
+
+        return wrapper
+
+    return decorator
 
 
 class FinalizeMixin:
@@ -13,6 +153,8 @@ class FinalizeMixin:
         super().__init__(*args, **kwargs)
         self._finalized = False
 
+    @_finalize_phase("finalize")
+    @_resolving_settings
     def finalize(self) -> None:
         """
         :obj:`~musicscore.finalize.FinalizeMixin` method
@@ -42,8 +184,12 @@ class FinalizeMixin:
             self.finalize()
 
         try:
-            return super().to_string(*args, **kwargs)
+            return self._serialize(*args, **kwargs)
         except AttributeError:
             raise ClassHasNoMusicXMLEquivalentError(
                 f"{self.__class__} has no direct equivalent in MusicXML and cannot be converted to string."
             )
+
+    @_finalize_phase("serialization")
+    def _serialize(self, *args, **kwargs):
+        return super().to_string(*args, **kwargs)
@@ -13,11 +13,16 @@ class Key(XMLWrapper):
 
     def __init__(self, fifths: int = 0, show: bool = True, *args, **kwargs):
         super().__init__()
-        self._xml_object = self.XMLClass(*args, **kwargs)
+        self._xml_object = self.XMLClass(*args, **kwargs) if args or kwargs else None
+        self._fifths = None
         self.fifths = fifths
         self._show = None
         self.show = show
 
+    def _create_xml_object(self):
+        self._xml_object = self.XMLClass()
+        self.xml_object.xml_fifths = self._fifths
+
     @property
     def fifths(self) -> Optional[int]:
         """
@@ -25,12 +30,16 @@ class Key(XMLWrapper):
 
         :return: ``self.xml_object.xml_fifths.value_``
         """
+        if self._xml_object is None:
+            return self._fifths
         if self.xml_object.xml_fifths:
             return self.xml_object.xml_fifths.value_
 
     @fifths.setter
     def fifths(self, val):
-        self.xml_object.xml_fifths = val
+        self._fifths = val
+        if self._xml_object is not None:
+            self.xml_object.xml_fifths = val
 
     @property
     def show(self) -> bool:
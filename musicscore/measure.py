@@ -3,16 +3,17 @@ from typing import List, Optional, Union
 
 from math import trunc
 
+from musicscore.accidental import SIGNS
 from musicscore.clef import BassClef, TrebleClef
 from musicscore.musictree import MusicTree
 from musicscore.exceptions import AlreadyFinalizedError, AddChordError
-from musicscore.finalize import FinalizeMixin
+from musicscore.finalize import FinalizeMixin, _finalize_phase
 from musicscore.key import Key
-from musicscore.quantize import QuantizeMixin
+from musicscore.quantize import QuantizeMixin, _resolving_settings
 from musicscore.staff import Staff
 from musicscore.time import Time, flatten_times
 from musicscore.tuplet import SimplifiedSextuplets
-from musicscore.util import lcm, _chord_is_in_a_repetition, isinstance_as_string
+from musicscore.util import lcm, _get_chords_in_a_repetition, isinstance_as_string
 from musicscore.voice import Voice
 from musicscore.xmlwrapper import XMLWrapper
 from musicxml.xmlelement.xmlelement import (
@@ -57,11 +58,11 @@ class Measure(
         super().__init__()
         self._updated = False
         self._xml_object = self.XMLClass(*args, **kwargs)
+        self._xml_attributes_are_set = False
         self.number = number
         self._time = None
         self._key = Key()
         self.time = time
-        self._set_attributes()
         self._new_system = False
         self._barlines = {"left": None, "right": None}
 
@@ -71,6 +72,13 @@ class Measure(
             voice.update_beats()
         return voice._add_chord(chord)
 
+    def _get_xml_object(self):
+        # xml attributes are created only when xml object is needed.
+        if not self._xml_attributes_are_set:
+            self._xml_attributes_are_set = True
+            self._set_attributes()
+        return self._xml_object
+
     def _set_attributes(self):
         self.xml_object.xml_attributes = XMLAttributes()
         self.xml_object.xml_attributes.xml_divisions = 1
@@ -112,46 +120,55 @@ class Measure(
         ]:
             b._split_unwritable_chords()
 
+    @_finalize_phase("accidentals")
     def _update_accidentals(self):
         for staff in self.get_children():
             if staff.show_accidental_signs == "modern":
                 previous_staff = staff.get_previous_staff()
+                if previous_staff:
+                    previous_steps_with_accidentals = (
+                        previous_staff.get_last_pitch_steps_with_accidentals()
+                    )
+                else:
+                    previous_steps_with_accidentals = set()
+                chords_in_a_repetition = set()
+                for voice in staff.get_children():
+                    chords_in_a_repetition.update(
+                        _get_chords_in_a_repetition(voice.get_chords())
+                    )
                 steps_with_accidentals = set()
                 relevant_chords = [ch for ch in staff.get_chords() if not ch.is_rest]
-                relevant_chords_not_tied = [
-                    ch
-                    for ch in relevant_chords
-                    if True not in set(m.is_tied_to_previous for m in ch.midis)
-                ]
+                first_chord_not_tied = next(
+                    (
+                        ch
+                        for ch in relevant_chords
+                        if not any(m.is_tied_to_previous for m in ch.midis)
+                    ),
+                    None,
+                )
                 for chord in relevant_chords:
                     for midi in chord.midis:
-                        step = midi.accidental.get_pitch_parameters()[0]
+                        step, alter, _ = midi.accidental.get_pitch_parameters()
+                        is_natural = SIGNS[alter] == "natural"
                         if midi.accidental.show is None:
-                            if midi.accidental.sign == "natural":
+                            if is_natural:
                                 if step in steps_with_accidentals:
                                     midi.accidental.show = True
                                     steps_with_accidentals.remove(step)
                                 elif (
-                                    relevant_chords_not_tied
-                                    and chord == relevant_chords_not_tied[0]
-                                    and previous_staff
-                                    and step
-                                    in previous_staff.get_last_pitch_steps_with_accidentals()
+                                    chord is first_chord_not_tied
+                                    and step in previous_steps_with_accidentals
                                 ):
                                     midi.accidental.show = True
                                 else:
                                     midi.accidental.show = False
                             else:
-                                if _chord_is_in_a_repetition(chord):
+                                if chord in chords_in_a_repetition:
                                     midi.accidental.show = False
                                 else:
                                     midi.accidental.show = True
-                                    if step not in steps_with_accidentals:
-                                        steps_with_accidentals.add(step)
-                        elif (
-                            midi.accidental.sign != "natural"
-                            and step not in steps_with_accidentals
-                        ):
+                                    steps_with_accidentals.add(step)
+                        elif not is_natural:
                             steps_with_accidentals.add(step)
             else:
                 raise NotImplementedError(
@@ -252,6 +269,7 @@ class Measure(
             for voice in staff.get_children():
                 voice.update_beats()
 
+    @_finalize_phase("xml_notes")
     def _update_xml_notes_backup_and_more(self):
         def add_backup():
             b = XMLBackup()
@@ -309,11 +327,11 @@ class Measure(
         :return: xml_object's number as integer
         :rtype: positive int
         """
-        return int(self.xml_object.number)
+        return int(self._xml_object.number)
 
     @number.setter
     def number(self, val):
-        self.xml_object.number = str(val)
+        self._xml_object.number = str(val)
 
     @property
     def new_system(self) -> bool:
@@ -390,6 +408,7 @@ class Measure(
 
         child._parent = self
         self._children.append(child)
+        self._reset_iterators()
 
         if self.previous is None:
             self._update_default_clefs()
@@ -456,6 +475,8 @@ class Measure(
         for staff in self.get_children():
             staff.fill_with_rests()
 
+    @_finalize_phase("finalize")
+    @_resolving_settings
     def finalize(self):
         """
         finalize can only be called once.
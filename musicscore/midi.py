@@ -2,11 +2,15 @@ import copy
 from math import log2
 from typing import Optional, Union
 
-from musicscore import STANDARD, ENHARMONIC, FLAT, SHARP, FORCEFLAT, FORCESHARP
 from musicscore.exceptions import AlreadyFinalizedError
 from musicxml.xmlelement.xmlelement import *  # type: ignore
 
-from musicscore.accidental import Accidental
+from musicscore.accidental import (
+    Accidental,
+    _ACCIDENTAL_MODES,
+    _SIGN_ALTERS,
+    _get_quarter_tone_class,
+)
 from musicscore.musictree import MusicTree
 
 __all__ = [
@@ -48,41 +52,23 @@ def get_accidental_mode(
     :param accidental_sign: ``double-flat``, ``flat-flat``, ``bb``, ``ff`` – ``three-quarters-flat`` – ``flat``, ``b``, ``f`` – ``quarter-flat`` – ``None``, ``natural`` – ``quarter-sharp`` – ``sharp``, ``#``, ``s`` – ``three-quarters-sharp`` – ``double-sharp``, ``sharp-sharp``, ``x``, ``##``, ``ss``
     :return: accidental_mode: ``standard``, ``enharmonic``, ``flat``, ``sharp``, ``force-flat``, ``force-sharp``
     """
-    # midi value is valid
-    Midi(midi_value)
-    if accidental_sign in [None, "natural"]:
-        accidental_value = 0
-    elif accidental_sign in ["quarter-sharp"]:
-        accidental_value = 0.5
-    elif accidental_sign in ["sharp", "#", "s"]:
-        accidental_value = 1
-    elif accidental_sign in ["three-quarters-sharp"]:
-        accidental_value = 1.5
-    elif accidental_sign in ["double-sharp", "sharp-sharp", "x", "##", "ss"]:
-        accidental_value = 2
-    elif accidental_sign in ["quarter-flat"]:
-        accidental_value = -0.5
-    elif accidental_sign in ["flat", "b", "f"]:
-        accidental_value = -1
-    elif accidental_sign in ["three-quarters-flat"]:
-        accidental_value = -1.5
-    elif accidental_sign in ["double-flat", "flat-flat", "bb", "ff"]:
-        accidental_value = -2
-    else:
+    _check_midi_value(midi_value)
+    try:
+        accidental_value = _SIGN_ALTERS[accidental_sign]
+    except KeyError:
         raise NotImplementedError(accidental_sign)
+    return _ACCIDENTAL_MODES.get(
+        (_get_quarter_tone_class(midi_value), accidental_value)
+    )
+
 
-    if STANDARD[midi_value % 12][1] == accidental_value:
-        return "standard"
-    elif ENHARMONIC[midi_value % 12][1] == accidental_value:
-        return "enharmonic"
-    elif FLAT[midi_value % 12][1] == accidental_value:
-        return "flat"
-    elif SHARP[midi_value % 12][1] == accidental_value:
-        return "sharp"
-    elif FORCEFLAT[midi_value % 12][1] == accidental_value:
-        return "force-flat"
-    elif FORCESHARP[midi_value % 12][1] == accidental_value:
-        return "force-sharp"
+def _check_midi_value(value):
+    if not isinstance(value, float) and not isinstance(value, int):
+        raise TypeError(f"Midi.value must be of type float or int not{type(value)}")
+    if value != 0 and (value < 12 or value > 127):
+        raise ValueError(
+            f"Midi.value {value} can be zero for a rest or must be in a range between 12 and 127 inclusively"
+        )
 
 
 class Midi(MusicTree):
@@ -130,29 +116,24 @@ class Midi(MusicTree):
             self.parent_note._update_xml_accidental()
 
     def _update_pitch_parameters(self):
+        if self._pitch_or_rest is None:
+            # pitch will be created with current parameters by get_pitch_or_rest()
+            return
         pitch = self.get_pitch_or_rest()
         if isinstance(pitch, XMLPitch):
-            if not self.accidental.get_pitch_parameters()[1]:
+            step, alter, octave = self.accidental.get_pitch_parameters()
+            if not alter:
                 if pitch.xml_alter:
                     pitch.remove(pitch.xml_alter)
-                pitch.xml_step, pitch.xml_octave = (
-                    self.accidental.get_pitch_parameters()[0],
-                    self.accidental.get_pitch_parameters()[2],
-                )
+                pitch.xml_step, pitch.xml_octave = step, octave
             else:
-                pitch.xml_step, pitch.xml_alter, pitch.xml_octave = (
-                    self.accidental.get_pitch_parameters()
-                )
+                pitch.xml_step, pitch.xml_alter, pitch.xml_octave = step, alter, octave
         else:
             raise TypeError
 
     def _update_pitch_or_rest(self):
-        if self._pitch_or_rest is None:
-            if self.value == 0:
-                self._pitch_or_rest = XMLRest()
-            else:
-                self._pitch_or_rest = XMLPitch()
-        else:
+        # Pitch or rest is created first if needed (see get_pitch_or_rest())
+        if self._pitch_or_rest is not None:
             if self.value == 0:
                 if not isinstance(self._pitch_or_rest, XMLRest):
                     self._pitch_or_rest = XMLRest()
@@ -164,8 +145,9 @@ class Midi(MusicTree):
                     self._pitch_or_rest = XMLPitch()
                     self._update_parent_note()
                 if self.accidental:
-                    self.accidental._update_xml_object()
                     self._update_pitch_parameters()
+        if self.value != 0 and self.accidental:
+            self.accidental._update_xml_object()
         if self.up:
             self.up._update_xml_pitch_or_rest()
 
@@ -268,12 +250,7 @@ class Midi(MusicTree):
 
     @value.setter
     def value(self, v):
-        if not isinstance(v, float) and not isinstance(v, int):
-            raise TypeError(f"Midi.value must be of type float or int not{type(v)}")
-        if v != 0 and (v < 12 or v > 127):
-            raise ValueError(
-                f"Midi.value {v} can be zero for a rest or must be in a range between 12 and 127 inclusively"
-            )
+        _check_midi_value(v)
         self._value = v
         self._update_pitch_or_rest()
 
@@ -338,6 +315,13 @@ class Midi(MusicTree):
         """
         :return: :obj:`~musicxml.xmlelement.xmlelement.XMLPitch` or :obj:`~musicxml.xmlelement.xmlelement.XMLRest` object associated with this :obj:`~musicscore.midi.Midi`.
         """
+        if self._pitch_or_rest is None:
+            if self.value == 0:
+                self._pitch_or_rest = XMLRest()
+            else:
+                self._pitch_or_rest = XMLPitch()
+                if self.accidental:
+                    self._update_pitch_parameters()
         return self._pitch_or_rest
 
     def get_staff_number(self):
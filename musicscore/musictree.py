@@ -1,11 +1,48 @@
 from typing import List
 
 from musicscore.exceptions import MusicTreeTypeError
-from musicscore.util import isinstance_as_string
+from musicscore.quantize import _clear_resolved_settings, _get_resolved_setting
+from musicscore.util import (
+    isinstance_as_string,
+    _get_local_attributes,
+    _get_mro_names,
+)
 from verysimpletree.tree import Tree
 
 __all__ = ["MusicTree"]
 
+_CLASS_NAMES = ["Score", "Part", "Measure", "Staff", "Voice", "Beat", "Chord"]
+
+_DEFAULT_KEYS = [
+    "part_number",
+    "measure_number",
+    "staff_number",
+    "voice_number",
+    "beat_number",
+    "chord_number",
+]
+
+_PARENT_CHILD = {
+    "Score": "Part",
+    "Part": "Measure",
+    "Measure": "Staff",
+    "Staff": "Voice",
+    "Voice": "Beat",
+    "Beat": "Chord",
+    "GraceChord": "Note",
+    "Rest": "Note",
+    "Chord": "Note",
+    "Note": "Midi",
+    "Midi": "Accidental",
+    "C": "Accidental",
+    "D": "Accidental",
+    "E": "Accidental",
+    "F": "Accidental",
+    "G": "Accidental",
+    "A": "Accidental",
+    "B": "Accidental",
+}
+
 
 class MusicTree(Tree):
     """
@@ -29,9 +66,16 @@ class MusicTree(Tree):
         "modern"  #: Class attribute of :obj:`~musicscore.musictree.MusicTree`
     )
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._LOCAL_ATTRIBUTES = _get_local_attributes(cls)
+        cls._MRO_NAMES = _get_mro_names(cls)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._show_accidental_signs = None
+        self._beats_index = None
+        self._chords_index = None
 
     @staticmethod
     def _check_args_kwargs(args, kwargs, class_name, get_class_name=None):
@@ -42,31 +86,11 @@ class MusicTree(Tree):
             if not isinstance(x, int) or x < 1:
                 raise TypeError(f"kwargs values {kwargs} must be positive integers")
 
-        def _get_default_keys():
-            default_keys = [
-                "part_number",
-                "measure_number",
-                "staff_number",
-                "voice_number",
-                "beat_number",
-                "chord_number",
-            ]
-            class_names = [
-                "Score",
-                "Part",
-                "Measure",
-                "Staff",
-                "Voice",
-                "Beat",
-                "Chord",
-            ]
-            class_index = class_names.index(class_name)
-            get_class_index = (
-                -1 if not get_class_name else class_names.index(get_class_name)
-            )
-            return default_keys[class_index:get_class_index]
-
-        default_keys = _get_default_keys()
+        class_index = _CLASS_NAMES.index(class_name)
+        get_class_index = (
+            -1 if not get_class_name else _CLASS_NAMES.index(get_class_name)
+        )
+        default_keys = _DEFAULT_KEYS[class_index:get_class_index]
         if args and kwargs:
             raise ValueError("Both args and kwargs cannot be set")
         if args:
@@ -89,31 +113,10 @@ class MusicTree(Tree):
                 f"MusicTree child must be of type MusicTree not {child.__class__}"
             )
 
-        parent_child = {
-            "Score": "Part",
-            "Part": "Measure",
-            "Measure": "Staff",
-            "Staff": "Voice",
-            "Voice": "Beat",
-            "Beat": "Chord",
-            "GraceChord": "Note",
-            "Rest": "Note",
-            "Chord": "Note",
-            "Note": "Midi",
-            "Midi": "Accidental",
-            "C": "Accidental",
-            "D": "Accidental",
-            "E": "Accidental",
-            "F": "Accidental",
-            "G": "Accidental",
-            "A": "Accidental",
-            "B": "Accidental",
-        }
-
         try:
-            if not isinstance_as_string(child, parent_child[self.__class__.__name__]):
+            if not isinstance_as_string(child, _PARENT_CHILD[self.__class__.__name__]):
                 raise MusicTreeTypeError(
-                    f"{self.__class__.__name__} accepts only children of type {parent_child[self.__class__.__name__]} not "
+                    f"{self.__class__.__name__} accepts only children of type {_PARENT_CHILD[self.__class__.__name__]} not "
                     f"{child.__class__.__name__}"
                 )
         except KeyError:
@@ -121,25 +124,37 @@ class MusicTree(Tree):
                 f"{self.__class__.__name__} add_child() not implemented."
             )
 
+    def _get_beats_index(self):
+        if isinstance_as_string(self, "Voice"):
+            return self.get_children()
+        if self._beats_index is None:
+            self._beats_index = [
+                beat
+                for child in self.get_children()
+                for beat in child._get_beats_index()
+            ]
+        return self._beats_index
+
+    def _get_chords_index(self):
+        if isinstance_as_string(self, "Beat"):
+            return self.get_children()
+        if self._chords_index is None:
+            self._chords_index = [
+                chord
+                for child in self.get_children()
+                for chord in child._get_chords_index()
+            ]
+        return self._chords_index
+
     def _get_kwargs(self, args_, kwargs_, get_class_name):
-        if isinstance_as_string(self, "Score"):
-            return self._check_args_kwargs(args_, kwargs_, "Score", get_class_name)
-        elif isinstance_as_string(self, "Part"):
-            return self._check_args_kwargs(args_, kwargs_, "Part", get_class_name)
-        elif isinstance_as_string(self, "Measure"):
-            return self._check_args_kwargs(args_, kwargs_, "Measure", get_class_name)
-        elif isinstance_as_string(self, "Staff"):
-            return self._check_args_kwargs(args_, kwargs_, "Staff", get_class_name)
-        elif isinstance_as_string(self, "Voice"):
-            return self._check_args_kwargs(args_, kwargs_, "Voice", get_class_name)
-        elif isinstance_as_string(self, "Beat"):
-            return self._check_args_kwargs(args_, kwargs_, "Beat", get_class_name)
-        elif isinstance_as_string(self, "Chord"):
-            return self._check_args_kwargs(args_, kwargs_, "Chord", get_class_name)
-        else:
-            raise MusicTreeTypeError(
-                f"MusicTree descendents of type {self.__class__} cannot use this method."
-            )
+        for class_name in _CLASS_NAMES:
+            if isinstance_as_string(self, class_name):
+                return self._check_args_kwargs(
+                    args_, kwargs_, class_name, get_class_name
+                )
+        raise MusicTreeTypeError(
+            f"MusicTree descendents of type {self.__class__} cannot use this method."
+        )
 
     def _get_music_tree_descendent(self, args, kwargs, get_class_name):
         kwargs = self._get_kwargs(args, kwargs, get_class_name)
@@ -147,19 +162,20 @@ class MusicTree(Tree):
         if not kwargs:
             raise TypeError
 
-        if len(kwargs) == 1:
-            try:
-                return self.get_children()[list(kwargs.values())[0] - 1]
-            except IndexError:
-                return None
-        else:
-            output = self
-            for key in kwargs:
-                string_to_eval = f"output.get_{key.split('_')[0]}(kwargs['{key}'])"
-                output = eval(string_to_eval)
-                if not output:
+        output = self
+        for key in _DEFAULT_KEYS:
+            if key in kwargs:
+                try:
+                    output = output.get_children()[kwargs[key] - 1]
+                except IndexError:
                     return None
-            return output
+        return output
+
+    def _reset_iterators(self):
+        # Flat beat and chord indexes are reset together with the tree iterators of self and all ancestors whenever children change.
+        super()._reset_iterators()
+        self._beats_index = None
+        self._chords_index = None
 
     @property
     def show_accidental_signs(self) -> str:
@@ -175,7 +191,7 @@ class MusicTree(Tree):
         """
         if self._show_accidental_signs is None:
             if self.up:
-                return self.up.show_accidental_signs
+                return _get_resolved_setting(self.up, "show_accidental_signs")
             else:
                 return self.default_show_accidental_signs
         return self._show_accidental_signs
@@ -189,6 +205,7 @@ class MusicTree(Tree):
             )
 
         self._show_accidental_signs = val
+        _clear_resolved_settings(self)
 
     def get_beat(self, *args, **kwargs) -> "Beat":
         """
@@ -234,7 +251,7 @@ class MusicTree(Tree):
         if isinstance_as_string(self, "Voice"):
             return self.get_children()
         else:
-            output = [ch for child in self.get_children() for ch in child.get_beats()]
+            output = self._get_beats_index()[:]
             if not output:
                 for cls_name in ["Beat", "Chord", "Note", "Midi", "Accidental"]:
                     if isinstance_as_string(self, cls_name):
@@ -256,7 +273,7 @@ class MusicTree(Tree):
         if isinstance_as_string(self, "Beat"):
             return self.get_children()
         else:
-            output = [ch for child in self.get_children() for ch in child.get_chords()]
+            output = self._get_chords_index()[:]
             if not output:
                 for cls_name in ["Chord", "Note", "Midi", "Accidental"]:
                     if isinstance_as_string(self, cls_name):
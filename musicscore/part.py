@@ -1,14 +1,16 @@
-from typing import List, Optional, Union, Tuple
+from typing import Iterable, List, Optional, Union, Tuple
 
 from musicscore import Chord
+from musicscore.chord import GraceChord, _update_split_lyrics
+from musicscore.chordtable import _create_tied_chord
 from musicscore.exceptions import (
     VoiceIsFullError,
     AlreadyFinalizedError,
 )
-from musicscore.finalize import FinalizeMixin
+from musicscore.finalize import FinalizeMixin, _finalize_phase
 from musicscore.measure import Measure
 from musicscore.musictree import MusicTree
-from musicscore.quantize import QuantizeMixin
+from musicscore.quantize import QuantizeMixin, _resolving_settings
 from musicscore.time import Time
 from musicscore.tuplet import SimplifiedSextuplets
 from musicscore.xmlwrapper import XMLWrapper
@@ -172,9 +174,23 @@ class Part(MusicTree, SimplifiedSextuplets, QuantizeMixin, FinalizeMixin, XMLWra
         if self._finalized is True:
             raise AlreadyFinalizedError(self, "add_child")
         super().add_child(child)
-        self.xml_object.add_child(child.xml_object)
+        self.xml_object.add_child(child._xml_object)
         return child
 
+    def remove(self, child: Measure) -> None:
+        """
+        Removes a measure and its xml object from part.
+
+        :param child: :obj:`~musicscore.measure.Measure`
+        :return: None
+        """
+        super().remove(child)
+        self.xml_object.remove(child._xml_object)
+        for measures in self._current_measures.values():
+            for voice_number, measure in list(measures.items()):
+                if measure is child:
+                    del measures[voice_number]
+
     def add_chord(
         self,
         chord: "Chord",
@@ -238,6 +254,172 @@ class Part(MusicTree, SimplifiedSextuplets, QuantizeMixin, FinalizeMixin, XMLWra
                 staff_number=staff_number, voice_number=voice_number
             ).leftover_chord
 
+    def add_chords(
+        self,
+        chords: Iterable["Chord"],
+        *,
+        staff_number: Optional[int] = None,
+        voice_number: Optional[int] = 1,
+    ) -> None:
+        """
+        Adds chords one after another to the specified voice. The result is the same as calling :obj:`add_chord()` for each chord, but
+        current measure and voice are kept between chords and full voices are detected without raising
+        :obj:`~musicscore.exceptions.VoiceIsFullError`.
+
+        :param chords: iterable of :obj:`~musicscore.chord.Chord`
+        :param staff_number: positive int, None. If None is set to 1.
+        :param voice_number: positive_int
+        :return: None
+        """
+        if self._finalized is True:
+            raise AlreadyFinalizedError(self, "add_chords")
+        if staff_number is None:
+            staff_number = 1
+
+        current_measure = None
+        current_voice = None
+        for chord in chords:
+            if not isinstance(chord, Chord):
+                raise TypeError(f"{chord} must be of type Chord.")
+            if (
+                isinstance(chord, GraceChord)
+                or chord._grace_chords["before"]
+                or chord._grace_chords["after"]
+            ):
+                self.add_chord(
+                    chord, staff_number=staff_number, voice_number=voice_number
+                )
+                current_measure = None
+                continue
+
+            if current_measure is None:
+                current_measure = self._get_first_measure_to_add_to(
+                    staff_number, voice_number
+                )
+                current_voice = self._get_voice_to_add_to(
+                    current_measure, staff_number, voice_number
+                )
+
+            while current_voice.is_filled:
+                current_measure = self._get_next_measure_to_add_to(current_measure)
+                current_voice = self._get_voice_to_add_to(
+                    current_measure, staff_number, voice_number
+                )
+            current_voice._add_chord(chord)
+
+            while current_voice.leftover_chord:
+                leftover_chord = current_voice.leftover_chord
+                current_measure = self._get_next_measure_to_add_to(current_measure)
+                current_voice = self._get_voice_to_add_to(
+                    current_measure, staff_number, voice_number
+                )
+                current_voice._add_chord(leftover_chord)
+
+    def add_chord_table(
+        self,
+        chord_table: "ChordTable",
+        *,
+        staff_number: Optional[int] = None,
+        voice_number: Optional[int] = 1,
+    ) -> None:
+        """
+        Adds rows of a :obj:`~musicscore.chordtable.ChordTable` to the specified voice. Measures, beats and the beatwise sections of
+        each row are computed from the table's columns and the beats of the voice. A :obj:`~musicscore.chord.Chord` is created only
+        when a section of a row is placed in a beat: the first section gets the row's dynamics and lyric, each following section is a
+        new tied chord created from the row's midi values. The chords are not split after being created, as it is the case with
+        :obj:`add_chord()` and :obj:`add_chords()`. The result is the same as adding the table's chords via :obj:`add_chords()`.
+
+        :param chord_table: :obj:`~musicscore.chordtable.ChordTable`
+        :param staff_number: positive int, None. If None is set to 1.
+        :param voice_number: positive_int
+        :return: None
+        """
+        if self._finalized is True:
+            raise AlreadyFinalizedError(self, "add_chord_table")
+        if staff_number is None:
+            staff_number = 1
+        if not len(chord_table):
+            return
+        current_measure = self._get_first_measure_to_add_to(staff_number, voice_number)
+        current_voice = self._get_voice_to_add_to(
+            current_measure, staff_number, voice_number
+        )
+        for index in range(len(chord_table)):
+            quarter_duration, midis = chord_table._get_row(index)
+            chord = None
+            while True:
+                while current_voice.is_filled:
+                    current_measure = self._get_next_measure_to_add_to(current_measure)
+                    current_voice = self._get_voice_to_add_to(
+                        current_measure, staff_number, voice_number
+                    )
+                beat = current_voice.get_current_beat()
+                remaining = beat.quarter_duration - beat.filled_quarter_duration
+                if quarter_duration <= remaining:
+                    if chord is None:
+                        chord = chord_table._create_chord(
+                            index, midis, quarter_duration
+                        )
+                    beat.add_child(chord)
+                    break
+                beats = current_voice.get_children()[
+                    current_voice.get_current_beat_index() :
+                ]
+                sections, leftover = quarter_duration._get_beatwise_sections(
+                    offset=beat.filled_quarter_duration, beats=beats
+                )
+                if chord is None:
+                    chord = chord_table._create_chord(index, midis, sections[0])
+                else:
+                    chord.quarter_duration = sections[0]
+                chord.split = True
+                beat.add_child(chord)
+                tied_chords = [chord]
+                for section in sections[1:]:
+                    tied_chord = _create_tied_chord(midis, section)
+                    tied_chord.split = True
+                    current_voice.get_current_beat().add_child(tied_chord)
+                    tied_chords[-1].add_tie("start")
+                    tied_chord.add_tie("stop")
+                    tied_chords.append(tied_chord)
+                if leftover:
+                    chord = _create_tied_chord(midis, leftover)
+                    tied_chords[-1].add_tie("start")
+                    chord.add_tie("stop")
+                    tied_chords.append(chord)
+                    current_voice.leftover_chord = chord
+                else:
+                    current_voice.leftover_chord = None
+                _update_split_lyrics(tied_chords)
+                if not leftover:
+                    break
+                quarter_duration = leftover
+                current_measure = self._get_next_measure_to_add_to(current_measure)
+                current_voice = self._get_voice_to_add_to(
+                    current_measure, staff_number, voice_number
+                )
+
+    def _get_first_measure_to_add_to(self, staff_number, voice_number):
+        measure = self.get_current_measure(
+            staff_number=staff_number, voice_number=voice_number
+        )
+        if not measure:
+            if self.get_children():
+                measure = self.get_children()[0]
+            else:
+                measure = self.add_measure()
+        return measure
+
+    def _get_next_measure_to_add_to(self, measure):
+        return measure.next if measure.next else self.add_measure()
+
+    @staticmethod
+    def _get_voice_to_add_to(measure, staff_number, voice_number):
+        voice = measure.add_voice(staff_number=staff_number, voice_number=voice_number)
+        if not voice.get_children():
+            voice.update_beats()
+        return voice
+
     def add_measure(
         self,
         time: Optional[Union[Time, List, Tuple]] = None,
@@ -332,11 +514,17 @@ class Part(MusicTree, SimplifiedSextuplets, QuantizeMixin, FinalizeMixin, XMLWra
         else:
             self._current_measures[staff_number] = {voice_number: measure}
 
-    def finalize(self) -> None:
+    @_finalize_phase("quantization")
+    def _prepare_for_finalize(self):
         if not self.get_children():
             self.add_measure()
         self.get_children()[-1].fill_with_rests()
         for beat in self.get_beats():
             if beat.get_quantized:
                 beat.quantize_quarter_durations()
+
+    @_finalize_phase("finalize")
+    @_resolving_settings
+    def finalize(self) -> None:
+        self._prepare_for_finalize()
         super().finalize()
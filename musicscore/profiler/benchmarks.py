@@ -0,0 +1,279 @@
+"""
+Benchmark suite for musicscore.
+
+Each scenario builds a score and serializes it with ``Score.to_string()``, except ``add_chord`` which only measures ``Part.add_chord``.
+Every scenario runs in its own python process, so that peak RSS values do not influence each other. For each scenario wall time (best of
+``repeat`` runs), peak traced memory of one run with ``tracemalloc``, the number of memory blocks which are still allocated by this run
+when the score has been serialized (taken from a ``tracemalloc`` snapshot) and peak RSS of the process are reported.
+
+Usage::
+
+    python -m musicscore.profiler.benchmarks run --output baseline.json
+    python -m musicscore.profiler.benchmarks run --output current.json
+    python -m musicscore.profiler.benchmarks compare baseline.json current.json --threshold 0.1
+
+``--output`` is required, so that the committed baseline (:obj:`BASELINE_PATH`) is only overwritten if it is passed explicitly.
+
+``compare`` exits with status 1 if any value of any scenario in current is larger than in baseline by more than ``threshold`` (relative).
+"""
+
+import argparse
+import json
+import random
+import subprocess
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None
+
+from musicscore.chord import Chord
+from musicscore.quarterduration import QuarterDuration
+from musicscore.score import Score
+from musicscore.profiler.subdivisions import (
+    generate_all_quintuplets_manually,
+    generate_all_sextuplets_manually,
+    generate_all_septuplets_manually,
+    generate_all_triplets_manually,
+)
+
+__all__ = ["SCENARIOS", "run_scenario", "run", "compare"]
+
+BASELINE_PATH = Path(__file__).parent / "benchmarks_baseline.json"
+METRICS = ("wall_time", "traced_memory_peak", "allocated_blocks", "rss_peak")
+_MODULE_NAME = "musicscore.profiler.benchmarks"
+
+
+def hello_world():
+    s = Score()
+    p = s.add_part("p1")
+    p.add_chord(Chord(60, 4))
+    s.to_string()
+    return s
+
+
+def long_single_part(number_of_measures=1000):
+    s = Score()
+    p = s.add_part("p1")
+    midis = [60, 62, 64, 65, 67, 69, 71, 72]
+    for i in range(number_of_measures):
+        p.add_chord(Chord(midis[i % len(midis)], 4))
+    s.to_string()
+    return s
+
+
+def orchestral_tutti(number_of_parts=30, number_of_measures=16):
+    s = Score()
+    for part_number in range(1, number_of_parts + 1):
+        p = s.add_part(f"p{part_number}")
+        for i in range(number_of_measures * 4):
+            p.add_chord(Chord([48 + part_number, 55 + part_number], 1))
+    s.to_string()
+    return s
+
+
+def dense_tuplets():
+    s = Score()
+    p = s.add_part("p1")
+    p.add_measure(time=(1, 4))
+    tuplets = (
+        generate_all_triplets_manually()
+        + generate_all_quintuplets_manually()
+        + generate_all_sextuplets_manually()
+        + generate_all_septuplets_manually()
+    )
+    for tuplet_list in tuplets:
+        for tuplet in tuplet_list:
+            p.add_chord(Chord(60, tuplet))
+    s.to_string()
+    return s
+
+
+def random_quantization(total_quarter_duration=200):
+    s = Score(get_quantized=True)
+    p = s.add_part("p1")
+    random.seed(11)
+    quarter_durations = []
+    while sum(quarter_durations) < total_quarter_duration - 4:
+        quarter_durations.append(
+            QuarterDuration(random.random() + random.randint(0, 3))
+        )
+    quarter_durations.append(total_quarter_duration - sum(quarter_durations))
+    for qd in quarter_durations:
+        p.add_chord(Chord(71, qd))
+    s.to_string()
+    return s
+
+
+def vocal_lyrics(number_of_parts=4, number_of_measures=20):
+    s = Score()
+    syllables = ["la", "li", "lo", "lu", "le"]
+    for part_number in range(1, number_of_parts + 1):
+        p = s.add_part(f"p{part_number}")
+        for i in range(number_of_measures * 4):
+            ch = Chord(60 + part_number + i % 7, 1)
+            ch.add_lyric(syllables[i % len(syllables)])
+            ch.add_lyric(str(i), number="2")
+            p.add_chord(ch)
+    s.to_string()
+    return s
+
+
+def sustained_drones(number_of_parts=4, number_of_chords=4):
+    # Long chords tied across many measures. Each segment is a Chord with its own Midi and Accidental copies (_split_copy). Creating
+    # them lazily as a tied chain is not implemented: _split_copy takes about 0.5% of this scenario and the finalize passes
+    # (accidental signs, pitches of notes) need every segment's accidental anyway.
+    s = Score()
+    for part_number in range(1, number_of_parts + 1):
+        p = s.add_part(f"p{part_number}")
+        for i in range(number_of_chords):
+            midis = [36 + part_number, 43 + part_number, 52 + part_number]
+            p.add_chord(Chord(midis, 37.5 + i))
+    s.to_string()
+    return s
+
+
+def add_chord(number_of_chords=2000):
+    # Only builds the tree: type tests of MusicTree nodes (isinstance_as_string) are a large part of Part.add_chord.
+    s = Score()
+    p = s.add_part("p1")
+    for i in range(number_of_chords):
+        p.add_chord(Chord(60 + i % 24, 0.5))
+    return s
+
+
+#: Benchmark scenarios. Keys are used as names in reports.
+SCENARIOS = {
+    "hello_world": hello_world,
+    "long_single_part": long_single_part,
+    "orchestral_tutti": orchestral_tutti,
+    "dense_tuplets": dense_tuplets,
+    "random_quantization": random_quantization,
+    "vocal_lyrics": vocal_lyrics,
+    "sustained_drones": sustained_drones,
+    "add_chord": add_chord,
+}
+
+
+def _get_rss_peak():
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is measured in kilobytes on linux and in bytes on macOS.
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def run_scenario(name, repeat=3):
+    """
+    Runs one scenario in the current process.
+
+    :param name: key of :obj:`SCENARIOS`
+    :param repeat: number of timed runs. The best one is reported.
+    :return: dictionary with :obj:`METRICS` as keys.
+    """
+    scenario = SCENARIOS[name]
+    wall_time = min(timeit.repeat(scenario, number=1, repeat=repeat))
+    tracemalloc.start()
+    # The score is kept alive until the snapshot has been taken.
+    score = scenario()
+    traced_memory_peak = tracemalloc.get_traced_memory()[1]
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    del score
+    return {
+        "wall_time": wall_time,
+        "traced_memory_peak": traced_memory_peak,
+        "allocated_blocks": sum(
+            statistic.count for statistic in snapshot.statistics("filename")
+        ),
+        "rss_peak": _get_rss_peak(),
+    }
+
+
+def run(names=None, repeat=3):
+    """
+    Runs scenarios each in a separate python process.
+
+    :param names: list of keys of :obj:`SCENARIOS`. If ``None`` all scenarios are run.
+    :param repeat: see :obj:`run_scenario`
+    :return: dictionary of scenario names and their results.
+    """
+    output = {}
+    for name in names or SCENARIOS:
+        completed = subprocess.run(
+            [sys.executable, "-m", _MODULE_NAME, "_run_one", name, str(repeat)],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        output[name] = json.loads(completed.stdout.splitlines()[-1])
+    return output
+
+
+def compare(baseline, current, threshold=0.1):
+    """
+    :param baseline: results of :obj:`run`
+    :param current: results of :obj:`run`
+    :param threshold: permitted relative increase of each metric.
+    :return: list of regressions as tuples (scenario name, metric, baseline value, current value)
+    """
+    regressions = []
+    for name, current_results in current.items():
+        baseline_results = baseline.get(name)
+        if not baseline_results:
+            continue
+        for metric in METRICS:
+            old, new = baseline_results.get(metric), current_results.get(metric)
+            if old is None or new is None:
+                continue
+            if new > old * (1 + threshold):
+                regressions.append((name, metric, old, new))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog=_MODULE_NAME)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    run_parser = subparsers.add_parser("run", help="run benchmarks")
+    run_parser.add_argument("--output", required=True)
+    run_parser.add_argument("--repeat", type=int, default=3)
+    run_parser.add_argument("--scenarios", nargs="*", choices=list(SCENARIOS))
+    compare_parser = subparsers.add_parser(
+        "compare", help="compare two benchmark results"
+    )
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.1)
+    run_one_parser = subparsers.add_parser("_run_one")
+    run_one_parser.add_argument("name", choices=list(SCENARIOS))
+    run_one_parser.add_argument("repeat", type=int)
+    args = parser.parse_args(argv)
+
+    if args.command == "_run_one":
+        print(json.dumps(run_scenario(args.name, args.repeat)))
+        return 0
+    if args.command == "run":
+        results = run(args.scenarios, args.repeat)
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        for name, values in results.items():
+            print(f"{name}: {values['wall_time']:.3f}s")
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+    regressions = compare(baseline, current, args.threshold)
+    for name, metric, old, new in regressions:
+        print(f"REGRESSION {name} {metric}: {old} -> {new} ({new / old - 1:+.1%})")
+    if not regressions:
+        print("No regressions.")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+"""
+Memory benchmark: traced bytes per note of a piano part (two staves, four chords with two midis in each staff and measure) after
+building the score and before finalizing it.
+
+Usage::
+
+    python -m musicscore.profiler.memory_per_note --measures 10000
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from musicscore.chord import Chord
+from musicscore.score import Score
+
+__all__ = ["get_bytes_per_note"]
+
+
+def _create_piano_score(number_of_measures):
+    score = Score()
+    part = score.add_part("piano")
+    number_of_chords = number_of_measures * 4
+    part.add_chords(
+        (Chord([60 + i % 12, 67 + i % 12], 1) for i in range(number_of_chords)),
+        staff_number=1,
+    )
+    part.add_chords(
+        (Chord([36 + i % 12, 43 + i % 12], 1) for i in range(number_of_chords)),
+        staff_number=2,
+    )
+    return score
+
+
+def get_bytes_per_note(number_of_measures=10000):
+    """
+    :param number_of_measures: number of measures of the piano part
+    :return: traced memory of the score divided by number of midis
+    """
+    gc.collect()
+    tracemalloc.start()
+    score = _create_piano_score(number_of_measures)
+    gc.collect()
+    traced_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    number_of_notes = sum(len(chord.midis) for chord in score.get_chords())
+    return traced_memory / number_of_notes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="musicscore.profiler.memory_per_note")
+    parser.add_argument("--measures", type=int, default=10000)
+    args = parser.parse_args(argv)
+    print(
+        f"{args.measures} measures: {get_bytes_per_note(args.measures):.0f} bytes per note"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,7 @@ from pathlib import Path
 from musicscore.chord import Chord
 from musicscore.part import Part
 from musicscore.score import Score
-from musicscore.tests.util_subdivisions import (
+from musicscore.profiler.subdivisions import (
     generate_all_quintuplets_manually,
     generate_all_sextuplets_manually,
     generate_all_septuplets_manually,
@@ -1,3 +1,8 @@
+"""
+Generators of all rhythmic patterns of a beat subdivision (triplets, quintuplets etc.). They are used by the benchmarks and profilers
+of this package and by the tests.
+"""
+
 import itertools
 import math
 
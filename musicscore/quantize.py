@@ -1,16 +1,90 @@
+from functools import wraps
 from typing import Optional, List
 
 from musicscore.quarterduration import QuarterDuration
 from musicscore.util import isinstance_as_string
 
+#:
+QUANTIZATION_ENGINES = ("exhaustive", "windowed")
+
+# Inherited settings of QuantizeMixin nodes resolved while finalizing are kept in a dictionary {(node, name): value} on the root of the
+# tree which is being finalized. Nodes keep a reference to it, so that the root has to be looked up only once per node. The position of
+# these nodes (Score to Beat) in the tree does not change during finalization.
+
+
+class _ResolvedSettings(dict):
+    def __init__(self):
+        super().__init__()
+        self.active = True
+
+
+def _get_root(node):
+    # Setters are also called in __init__ before the tree attributes of node exist.
+    parent = node.__dict__.get("_parent")
+    while parent is not None:
+        node = parent
+        parent = node.__dict__.get("_parent")
+    return node
+
+
+def _get_resolved_settings(node):
+    resolved_settings = node.__dict__.get("_resolved_settings")
+    if resolved_settings is not None and resolved_settings.active:
+        return resolved_settings
+    resolved_settings = _get_root(node).__dict__.get("_resolved_settings")
+    if resolved_settings is not None:
+        node.__dict__["_resolved_settings"] = resolved_settings
+    return resolved_settings
+
+
+def _resolving_settings(method):
+    # Decorator caching resolved settings while the outermost decorated method of a tree is running.
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        root = _get_root(self)
+        resolved_settings = root.__dict__.get("_resolved_settings")
+        if resolved_settings is not None and resolved_settings.active:
+            return method(self, *args, **kwargs)
+        resolved_settings = root._resolved_settings = _ResolvedSettings()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            resolved_settings.active = False
+            resolved_settings.clear()
+            root._resolved_settings = None
+
+    return wrapper
+
+
+def _get_resolved_setting(node, name):
+    if not isinstance(node, QuantizeMixin):
+        return getattr(node, name)
+    resolved_settings = _get_resolved_settings(node)
+    if resolved_settings is None:
+        return getattr(node, name)
+    key = (node, name)
+    try:
+        return resolved_settings[key]
+    except KeyError:
+        value = resolved_settings[key] = getattr(node, name)
+        return value
+
+
+def _clear_resolved_settings(node):
+    # Must be called by setters of inherited settings.
+    resolved_settings = _get_resolved_settings(node)
+    if resolved_settings is not None:
+        resolved_settings.clear()
+
 
 class QuantizeMixin:
-    _ATTRIBUTES = {"get_quantized"}
+    _ATTRIBUTES = {"get_quantized", "quantization_engine"}
 
     def __init__(self, get_quantized=None, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._possible_subdivisions = {}
         self._get_quantized = None
+        self._quantization_engine = None
         self.get_quantized = get_quantized
 
     def _get_beat_quarter_duration(self):
@@ -35,7 +109,7 @@ class QuantizeMixin:
         """
         if self._get_quantized is None:
             if self.up:
-                return self.up.get_quantized
+                return _get_resolved_setting(self.up, "get_quantized")
             else:
                 return False
         return self._get_quantized
@@ -43,6 +117,41 @@ class QuantizeMixin:
     @get_quantized.setter
     def get_quantized(self, val):
         self._get_quantized = val
+        _clear_resolved_settings(self)
+
+    @property
+    def quantization_engine(self) -> str:
+        """
+        :obj:`~musicscore.quantize.QuantizeMixin` property
+
+        Engine used by :obj:`musicscore.beat.Beat.quantize_quarter_durations()` to find the best subdivision. Possible values are
+        :obj:`~musicscore.quantize.QUANTIZATION_ENGINES`:
+
+        - ``exhaustive``: every chord position is compared to every grid point of each possible subdivision.
+        - ``windowed``: every chord position is only compared to the two grid points surrounding it. The result is identical to
+          ``exhaustive``. For very fine grids (grid step not larger than 1/500) ``exhaustive`` is used as fallback.
+
+        - If ``quantization_engine`` is set to None the first ``quantization_engine`` of ancestors which is not ``None`` will be returned.
+        - If :obj:`musicscore.score.Score.quantization_engine` is set to None it will be converted to ``exhaustive``
+
+        :type: Optional[str]
+        :rtype: str
+        """
+        if self._quantization_engine is None:
+            if self.up:
+                return _get_resolved_setting(self.up, "quantization_engine")
+            else:
+                return QUANTIZATION_ENGINES[0]
+        return self._quantization_engine
+
+    @quantization_engine.setter
+    def quantization_engine(self, val):
+        if val is not None and val not in QUANTIZATION_ENGINES:
+            raise ValueError(
+                f"quantization_engine {val} must be None or one of {QUANTIZATION_ENGINES}"
+            )
+        self._quantization_engine = val
+        _clear_resolved_settings(self)
 
     def get_possible_subdivisions(
         self, beat_quarter_duration: Optional[QuarterDuration] = None
@@ -69,14 +178,13 @@ class QuantizeMixin:
         """
         if beat_quarter_duration is None:
             beat_quarter_duration = self._get_beat_quarter_duration()
-        subdivisions = self._possible_subdivisions.get(beat_quarter_duration)
-        if (
-            subdivisions is None
-            and self.up is not None
-            and self.up.get_possible_subdivisions(beat_quarter_duration) is not None
-        ):
-            subdivisions = self.up.get_possible_subdivisions(beat_quarter_duration)[:]
-        return subdivisions
+        node = self
+        while node is not None:
+            subdivisions = node._possible_subdivisions.get(beat_quarter_duration)
+            if subdivisions is not None:
+                return subdivisions if node is self else subdivisions[:]
+            node = node.up
+        return None
 
     def set_possible_subdivisions(
         self,
@@ -1,3 +1,7 @@
+import sys
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_all_start_methods, get_context
 from typing import Union, Optional
 
 from musicscore import Part, Chord
@@ -7,16 +11,18 @@ from musicscore.exceptions import (
     ScoreHasNoPartsError,
     ScoreMultiMeasureRestError,
     ScorePartIdIsNotUniqueError,
+    ScoreXMLReleasedError,
 )
-from musicscore.finalize import FinalizeMixin
+from musicscore.finalize import FinalizeMixin, _finalize_phase
 from musicscore.layout import Scaling, PageLayout, SystemLayout, StaffLayout
 from musicscore.musictree import MusicTree
-from musicscore.quantize import QuantizeMixin
+from musicscore.quantize import QuantizeMixin, _resolving_settings
 from musicscore.quarterduration import QuarterDuration
 from musicscore.tuplet import SimplifiedSextuplets
 from musicscore.xmlwrapper import XMLWrapper
 from musicxml.xmlelement.xmlelement import (
     XMLScorePartwise,
+    XMLPart,
     XMLPartList,
     XMLCredit,
     XMLCreditWords,
@@ -31,8 +37,16 @@ from musicxml.xmlelement.xmlelement import (
     XMLGroupAbbreviation,
     XMLMeasureStyle,
 )
-
-__all__ = ["TITLE", "SUBTITLE", "POSSIBLE_SUBDIVISIONS", "Score"]
+from musicxml.xsd.xsdelement import XSDElement
+
+__all__ = [
+    "TITLE",
+    "SUBTITLE",
+    "POSSIBLE_SUBDIVISIONS",
+    "XML_HEADER",
+    "VALIDATION_MODES",
+    "Score",
+]
 #:
 TITLE = {
     "font_size": 24,
@@ -57,6 +71,88 @@ POSSIBLE_SUBDIVISIONS = {
     QuarterDuration(1): [2, 3, 4, 5, 6, 7, 8],
 }
 
+#:
+XML_HEADER = """<?xml version="1.0" encoding="UTF-8" standalone="no"?>
+<!DOCTYPE score-partwise PUBLIC
+    "-//Recordare//DTD MusicXML 4.0 Partwise//EN"
+    "http://www.musicxml.org/dtds/partwise.dtd">
+"""
+
+#: Possible values of :obj:`Score.validation`
+VALIDATION_MODES = ("eager", "deferred", "off")
+
+
+def _get_start_tag(xml_object):
+    element = ET.Element(
+        xml_object.name, {k: str(v) for k, v in xml_object.attributes.items()}
+    )
+    return ET.tostring(element, encoding="unicode")[: -len(" />")] + ">"
+
+
+def _xml_object_to_string(xml_object, final_checks=True):
+    # Same output as xml_object.to_string(), but the final checks can be skipped and the xml elements of
+    # etree are only created once.
+    if final_checks:
+        xml_object._final_checks()
+    xml_object._create_et_xml_element()
+    return ET.tostring(xml_object._et_xml_element, encoding="unicode") + "\n"
+
+
+_FORK = "fork"
+# Forking a process which has imported system frameworks is not safe on macOS.
+_CAN_FORK = sys.platform.startswith("linux") and _FORK in get_all_start_methods()
+
+# Score whose parts are finalized by a forked worker process of Score.export_xml(workers=...). It is only set in worker processes by the
+# initializer of their pool.
+_worker_score = None
+
+
+def _init_worker(score):
+    global _worker_score
+    _worker_score = score
+
+
+def _get_finalized_part_string(part_index):
+    part = _worker_score.get_children()[part_index]
+    _worker_score._finalize_part(part)
+    return "  " + _xml_object_to_string(
+        part.xml_object, _worker_score.validation != "off"
+    )
+
+
+def _release_tree(tree):
+    # Breaks the references between the nodes of a tree, so that they are freed as soon as they are not referenced anymore, without
+    # waiting for the garbage collector.
+    for node in list(tree.traverse()):
+        node._parent = None
+        node._children = []
+        node._traversed = None
+        node._iterated_leaves = None
+        node._reversed_path_to_root = None
+
+
+def _release_xml_objects(xml_object):
+    # Drops the etree element, the children and the child container of a written xml element and of all its descendants. The musicxml
+    # objects which are still referenced by the tree (e.g. the xml objects of notes and pitches) keep only their own name, value and
+    # attributes. musicxml has no public api for this: the private attributes used here are those of the musicxml version pinned in
+    # pyproject.toml.
+    for child in xml_object.get_children(ordered=False):
+        _release_xml_objects(child)
+        child.parent_xsd_element = None
+    container = xml_object._child_container_tree
+    if container is not None:
+        for node in container.traverse():
+            node._parent_xml_element = None
+            node.content.parent_container = None
+            if isinstance(node.content, XSDElement):
+                node.content._xml_elements = []
+                # Each xsd element of a child container has its own copy of the xsd tree.
+                _release_tree(node.content.xsd_tree)
+        _release_tree(container)
+    xml_object._et_xml_element = None
+    xml_object._child_container_tree = None
+    xml_object._unordered_children = []
+
 
 class Score(MusicTree, QuantizeMixin, SimplifiedSextuplets, FinalizeMixin, XMLWrapper):
     """
@@ -74,6 +170,7 @@ class Score(MusicTree, QuantizeMixin, SimplifiedSextuplets, FinalizeMixin, XMLWr
         "system_layout",
         "staff_layout",
         "new_system",
+        "validation",
     }
     _ATTRIBUTES = _ATTRIBUTES.union(MusicTree._ATTRIBUTES)
     _ATTRIBUTES = _ATTRIBUTES.union(QuantizeMixin._ATTRIBUTES)
@@ -88,6 +185,7 @@ class Score(MusicTree, QuantizeMixin, SimplifiedSextuplets, FinalizeMixin, XMLWr
         get_quantized=False,
         simplified_sextuplets=None,
         new_system=False,
+        validation="eager",
         *args,
         **kwargs,
     ):
@@ -104,6 +202,8 @@ class Score(MusicTree, QuantizeMixin, SimplifiedSextuplets, FinalizeMixin, XMLWr
         self._staff_layout = None
         self._scaling = None
         self._new_system = None
+        self._validation = None
+        self._xml_released = False
 
         self.scaling = Scaling()
         self.page_layout = PageLayout()
@@ -112,6 +212,7 @@ class Score(MusicTree, QuantizeMixin, SimplifiedSextuplets, FinalizeMixin, XMLWr
         self.title = title
         self.subtitle = subtitle
         self.new_system = new_system
+        self.validation = validation
         self._possible_subdivisions = POSSIBLE_SUBDIVISIONS.copy()
 
         self._measure_numbers_within_multi_measure_rests = set()
@@ -356,6 +457,36 @@ class Score(MusicTree, QuantizeMixin, SimplifiedSextuplets, FinalizeMixin, XMLWr
                 credit.up.remove(credit)
                 self._title = None
 
+    @property
+    def validation(self) -> str:
+        """
+        Sets when the MusicXML schema checks (required children, values and attributes) of the whole xml tree are run during
+        export. Possible values are listed in :obj:`VALIDATION_MODES`:
+
+        - ``eager``: every serialized fragment (the whole score, each part or each measure in a streamed export) is checked before it is
+          written.
+        - ``deferred``: fragments are written without checks. One validation pass runs over the finished tree at the end of the export.
+          In a parallel export each part is checked once in its worker process. In a streamed export each measure is checked right after
+          it has been written, before its xml objects are released.
+        - ``off``: no checks are run.
+
+        The order of xml children is still determined while the tree is being built. The output is identical in all modes.
+
+        Only these export-time checks depend on the mode. Checks run while the score is being built are not affected: adding chords
+        (for example :obj:`~musicscore.beat.Beat.add_child()` checking quarter durations and midis) and setting attributes and
+        values of xml elements (type and pattern checks of the musicxml package) raise immediately in every mode.
+
+        :type: str
+        :rtype: str
+        """
+        return self._validation
+
+    @validation.setter
+    def validation(self, val):
+        if val not in VALIDATION_MODES:
+            raise ValueError(f"validation {val} must be one of {VALIDATION_MODES}")
+        self._validation = val
+
     @property
     def version(self) -> str:
         """
@@ -402,32 +533,133 @@ class Score(MusicTree, QuantizeMixin, SimplifiedSextuplets, FinalizeMixin, XMLWr
         p = Part(id)
         return self.add_child(p)
 
-    def export_xml(self, path: "pathlib.Path") -> None:
+    def export_xml(
+        self, path: "pathlib.Path", stream: bool = False, workers: Optional[int] = None
+    ) -> None:
         """
         Creates a musicxml file
 
         :param path: Output xml file
+        :param stream: If ``True`` measures are finalized and written to the file one at a time. The xml objects of each measure (its
+                       xml children, their child containers and serialized elements) are released as soon as the measure is written, so
+                       that the memory needed for the xml document does not grow with the number of measures. The output is identical to
+                       the one of a regular export. Afterwards the score is finalized, but it cannot be serialized again: further calls
+                       of :obj:`export_xml` or :obj:`to_string` raise a :obj:`~musicscore.exceptions.ScoreXMLReleasedError`.
+        :param workers: If set, parts are finalized and serialized in a pool of ``workers`` forked processes after the cross-part steps
+                        (missing measures, barlines) have been done. The part fragments are assembled in order. The score in the calling
+                        process is not finalized. Forked processes are only used on Linux. On other platforms, and if the score is
+                        already finalized, ``workers`` has no effect and the score is exported regularly. Cannot be combined with
+                        ``stream``.
         :return: None
+        :exception: :obj:`~musicscore.exceptions.ScoreXMLReleasedError` if the score has already been exported with ``stream``
         """
+        if stream and workers:
+            raise ValueError("export_xml: stream and workers cannot be combined.")
+        self._check_xml_is_not_released()
         with open(path, "+w") as f:
-            f.write("""<?xml version="1.0" encoding="UTF-8" standalone="no"?>
-<!DOCTYPE score-partwise PUBLIC
-    "-//Recordare//DTD MusicXML 4.0 Partwise//EN"
-    "http://www.musicxml.org/dtds/partwise.dtd">
-""")
-            f.write(self.to_string())
+            f.write(XML_HEADER)
+            if stream:
+                self._write_streamed(f)
+            elif workers and not self._finalized and _CAN_FORK:
+                self._write_parallel(f, workers)
+            else:
+                f.write(self.to_string())
 
-    def finalize(self) -> None:
+    def _check_xml_is_not_released(self):
+        if self._xml_released:
+            raise ScoreXMLReleasedError(
+                "Score has been exported with stream=True. Its xml objects are released and it cannot be serialized again."
+            )
+
+    def _prepare_for_finalize(self):
+        if self._finalized:
+            raise AlreadyFinalizedError(self)
         self._check_parts()
         self._create_missing_measures()
         self._set_missing_barlines()
         self._set_last_barline()
-        super().finalize()
-        for measure_number in self._measure_numbers_within_multi_measure_rests:
-            for part in self.get_children():
-                measure = part.get_measure(measure_number)
-                for ch in measure.get_chords():
-                    ch.notes[0].xml_rest.measure = "yes"
+
+    def _update_multi_measure_rest(self, measure_number, measure):
+        if measure_number in self._measure_numbers_within_multi_measure_rests:
+            for ch in measure.get_chords():
+                ch.notes[0].xml_rest.measure = "yes"
+
+    def _finalize_part(self, part):
+        part.finalize()
+        for measure_number, measure in enumerate(part.get_children(), 1):
+            self._update_multi_measure_rest(measure_number, measure)
+
+    def _write_start_and_header_elements(self, f, final_checks):
+        f.write(_get_start_tag(self.xml_object) + "\n")
+        for xml_child in self.xml_object.get_children():
+            if not isinstance(xml_child, XMLPart):
+                f.write("  " + _xml_object_to_string(xml_child, final_checks))
+
+    def _write_parallel(self, f, workers):
+        self._prepare_for_finalize()
+        # The score is inherited by forked processes and is not pickled.
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(self.get_children())),
+            mp_context=get_context(_FORK),
+            initializer=_init_worker,
+            initargs=(self,),
+        ) as executor:
+            part_strings = list(
+                executor.map(
+                    _get_finalized_part_string, range(len(self.get_children()))
+                )
+            )
+        self._write_start_and_header_elements(f, self.validation != "off")
+        for part_string in part_strings:
+            f.write(part_string)
+        f.write(f"</{self.xml_object.name}>\n")
+
+    def _write_streamed(self, f):
+        self._prepare_for_finalize()
+        self._xml_released = True
+        self._write_start_and_header_elements(f, self.validation == "eager")
+        for part in self.get_children():
+            # Parts which have already been finalized are only written (see finalize()).
+            part_is_finalized = part._finalized
+            if not part_is_finalized:
+                part._prepare_for_finalize()
+            f.write("  " + _get_start_tag(part.xml_object) + "\n")
+            for measure_number, measure in enumerate(part.get_children(), 1):
+                if not part_is_finalized:
+                    if not measure._finalized:
+                        measure.finalize()
+                    self._update_multi_measure_rest(measure_number, measure)
+                f.write(
+                    "    "
+                    + _xml_object_to_string(
+                        measure.xml_object, self.validation == "eager"
+                    )
+                )
+                if self.validation == "deferred":
+                    measure.xml_object._final_checks()
+                _release_xml_objects(measure.xml_object)
+            part._finalized = True
+            f.write(f"  </{part.xml_object.name}>\n")
+        f.write(f"</{self.xml_object.name}>\n")
+        self._finalized = True
+        if self.validation == "deferred":
+            self.xml_object._final_checks()
+
+    @_finalize_phase("serialization")
+    def _serialize(self, *args, **kwargs):
+        self._check_xml_is_not_released()
+        if self.validation == "off":
+            return _xml_object_to_string(self.xml_object, False)
+        return super()._serialize(*args, **kwargs)
+
+    @_finalize_phase("finalize")
+    @_resolving_settings
+    def finalize(self) -> None:
+        self._prepare_for_finalize()
+        for part in self.get_children():
+            if not part._finalized:
+                self._finalize_part(part)
+        self._finalized = True
 
     def group_parts(
         self,
@@ -118,6 +118,7 @@ class Staff(MusicTree, SimplifiedSextuplets, QuantizeMixin, FinalizeMixin, XMLWr
 
         child._parent = self
         self._children.append(child)
+        self._reset_iterators()
 
         return child
 
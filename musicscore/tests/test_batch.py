@@ -0,0 +1,142 @@
+import json
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from musicscore.batch import create_score, main, read_specs, render_batch
+
+SPECS = [
+    {
+        "name": "exercise",
+        "title": "Exercise",
+        "parts": [
+            {
+                "id": "p1",
+                "name": "Violin",
+                "time": [3, 4],
+                "key": -1,
+                "quarter_durations": [1, 0.5, 0.5, 1, 3],
+                "midis": [60, 62, [64, 67], 0, 70],
+            }
+        ],
+    },
+    {"parts": [{"quarter_durations": [1, -1], "midis": [60, 61]}]},
+    {
+        "parts": [
+            {"quarter_durations": [1.5, 2.5], "midis": [60, 61]},
+            {"id": "p2", "time": [6, 8], "quarter_durations": [3], "midis": [62]},
+        ]
+    },
+]
+
+
+class TestBatch(TestCase):
+    def test_create_score(self):
+        score = create_score(SPECS[0])
+        part = score.get_children()[0]
+        assert score.title.value_ == "Exercise"
+        assert part.name == "Violin"
+        assert part.get_children()[0].key.fifths == -1
+        assert [ch.quarter_duration for ch in part.get_chords()] == [1, 0.5, 0.5, 1, 3]
+
+    def test_read_specs(self):
+        with tempfile.TemporaryDirectory() as directory:
+            jsonl_path = Path(directory) / "specs.jsonl"
+            with open(jsonl_path, "w") as f:
+                for spec in SPECS:
+                    f.write(json.dumps(spec) + "\n\n")
+            assert [name for name, _ in read_specs(jsonl_path)] == [
+                "exercise",
+                "specs_3",
+                "specs_5",
+            ]
+            for index, spec in enumerate(SPECS):
+                with open(Path(directory) / f"{index}.json", "w") as f:
+                    json.dump(spec, f)
+            assert list(read_specs(directory)) == [
+                (str(index), spec) for index, spec in enumerate(SPECS)
+            ]
+
+    def test_render_batch(self):
+        specs = [(str(index), spec) for index, spec in enumerate(SPECS)]
+        with tempfile.TemporaryDirectory() as directory:
+            serial_results = render_batch(specs, Path(directory) / "serial", workers=1)
+            parallel_results = render_batch(
+                specs, Path(directory) / "parallel", workers=2
+            )
+            for results in [serial_results, parallel_results]:
+                assert [result.name for result in results] == ["0", "1", "2"]
+                assert [result.error is None for result in results] == [
+                    True,
+                    False,
+                    True,
+                ]
+            for serial, parallel in zip(serial_results, parallel_results):
+                if not serial.error:
+                    with open(serial.path) as f1, open(parallel.path) as f2:
+                        assert f1.read() == f2.read()
+
+    def test_main(self):
+        with tempfile.TemporaryDirectory() as directory:
+            jsonl_path = Path(directory) / "specs.jsonl"
+            with open(jsonl_path, "w") as f:
+                f.write(json.dumps(SPECS[0]) + "\n")
+            output_directory = Path(directory) / "xmls"
+            assert main([str(jsonl_path), "-o", str(output_directory)]) == 0
+            assert (output_directory / "exercise.xml").exists()
+
+    def test_main_with_invalid_and_duplicate_specs(self):
+        with tempfile.TemporaryDirectory() as directory:
+            jsonl_path = Path(directory) / "specs.jsonl"
+            with open(jsonl_path, "w") as f:
+                f.write(json.dumps(SPECS[0]) + "\n")
+                f.write("{not json\n")
+                f.write(json.dumps(SPECS[0]) + "\n")
+            output_directory = Path(directory) / "xmls"
+            assert main([str(jsonl_path), "-o", str(output_directory)]) == 1
+            assert (output_directory / "exercise.xml").exists()
+            assert (output_directory / "exercise_2.xml").exists()
+            assert not (output_directory / "specs_2.xml").exists()
+
+    def test_render_batch_with_duplicate_names(self):
+        specs = [("a", SPECS[0]), ("a_2", SPECS[2]), ("a", SPECS[0]), ("b", "[]")]
+        with tempfile.TemporaryDirectory() as directory:
+            results = render_batch(specs, directory, workers=1)
+        assert [result.name for result in results] == ["a", "a_2", "a_3", "b"]
+        assert [result.error is None for result in results] == [
+            True,
+            True,
+            True,
+            False,
+        ]
+
+    def test_render_batch_with_wrong_names(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output_directory = Path(directory) / "xmls"
+            absolute_name = str(Path(directory) / "absolute")
+            specs = [
+                ("../outside", SPECS[0]),
+                (absolute_name, SPECS[0]),
+                ("..", SPECS[0]),
+                (["a", "b"], SPECS[0]),
+                (3, SPECS[0]),
+            ]
+            results = render_batch(specs, output_directory, workers=1)
+            assert [result.error is None for result in results] == [
+                False,
+                False,
+                False,
+                True,
+                True,
+            ]
+            assert [result.path for result in results[:3]] == [None, None, None]
+            assert (
+                results[0].error == "ValueError: name '../outside' is not a file name."
+            )
+            assert [result.name for result in results[3:]] == ["['a', 'b']", "3"]
+            assert not (Path(directory) / "outside.xml").exists()
+            assert not Path(absolute_name + ".xml").exists()
+            assert sorted(path.name for path in output_directory.iterdir()) == [
+                "3.xml",
+                "['a', 'b'].xml",
+            ]
@@ -6,6 +6,11 @@ from musicscore.beat import (
     Beat,
     _convert_to_quarter_duration_splittables_dictionary,
     get_chord_group_subdivision,
+    get_split_cache_info,
+    clear_split_cache,
+    get_pattern_cache_info,
+    clear_pattern_cache,
+    beam_chord_group,
 )
 from musicscore.chord import Chord
 from musicscore.config import SPLITTABLES
@@ -268,6 +273,54 @@ class TestBeatSplitChord(TestCase):
         v.get_beat(1)._split_unwritable_chords()
         assert [ch.quarter_duration for ch in v.get_chords()] == [1 / 2, 1 / 3, 1 / 6]
 
+    def test_split_cache(self):
+        clear_split_cache()
+        assert get_split_cache_info()["splittables"].currsize == 0
+        for _ in range(2):
+            v = create_voice()
+            v.update_beats(1)
+            v._add_chord(Chord(60, 5 / 6))
+            v._add_chord(Chord(60, 1 / 6))
+            v.get_beat(1)._split_unwritable_chords()
+            assert [ch.quarter_duration for ch in v.get_chords()] == [
+                1 / 2,
+                1 / 3,
+                1 / 6,
+            ]
+            assert v.get_chords()[0].midis[0].is_tied_to_next
+        info = get_split_cache_info()["splittables"]
+        assert (info.hits, info.misses) == (2, 2)
+        clear_split_cache()
+        assert get_split_cache_info()["splittables"].currsize == 0
+
+    def test_pattern_cache(self):
+        clear_pattern_cache()
+        p = Part("p1")
+        for _ in range(4):
+            for qd in [1 / 4, 1 / 8, 1 / 8, 1 / 2]:
+                p.add_chord(Chord(60, qd))
+        p.finalize()
+        for beat in p.get_beats():
+            assert [ch.beams for ch in beat.get_chords()] == [
+                {1: "begin", 2: "begin"},
+                {1: "continue", 2: "continue", 3: "begin"},
+                {1: "continue", 2: "end", 3: "end"},
+                {1: "end"},
+            ]
+        info = get_pattern_cache_info()
+        assert (info["beams"].hits, info["beams"].misses) == (3, 1)
+        assert info["subdivisions"].misses == 1
+        assert (info["groups"].hits, info["groups"].misses) == (3, 1)
+        # manually set beams are kept
+        chords = [Chord(60, qd) for qd in [1 / 2, 1 / 2]]
+        for ch in chords:
+            ch.type = "eighth"
+        chords[0].set_beam(1, "continue")
+        beam_chord_group(chords)
+        assert [ch.beams for ch in chords] == [{1: "continue"}, {1: "end"}]
+        clear_pattern_cache()
+        assert get_pattern_cache_info()["beams"].currsize == 0
+
     def test_add_child_5_leftover(self):
         v = create_voice()
         beats = v.update_beats(1, 1, 1, 1)
@@ -0,0 +1,89 @@
+from fractions import Fraction
+from unittest import TestCase
+from unittest.mock import patch
+
+from musicscore.chord import Chord
+from musicscore.chordtable import ChordTable
+from musicscore.quarterduration import QuarterDuration
+from musicscore.score import Score
+from musicscore.time import Time
+
+
+class TestChordTable(TestCase):
+    def test_init(self):
+        midis = [60, (60, 64), 0]
+        t = ChordTable([1, 0.5, 2.5], midis)
+        assert len(t) == 3
+        assert t.midis is midis
+        assert t.dynamics is None
+        with self.assertRaises(ValueError):
+            ChordTable([1, 2], [60])
+        with self.assertRaises(ValueError):
+            ChordTable([1, -1], [60, 61])
+        with self.assertRaises(TypeError):
+            ChordTable([1], ["60"])
+
+    def test_rational_quarter_durations(self):
+        t = ChordTable(
+            [Fraction(1, 3)] * 3 + [QuarterDuration(1, 5)] * 5 + [2], [60] * 9
+        )
+        assert [ch.quarter_duration for ch in t.iterate_chords()] == [
+            Fraction(1, 3)
+        ] * 3 + [Fraction(1, 5)] * 5 + [2]
+        s = Score()
+        s.add_part("p1").add_chord_table(t)
+        s.finalize()
+
+    def test_get_chord(self):
+        t = ChordTable(
+            [1, 2], [60, [61, 65]], dynamics=["ff", None], lyrics=[None, "la"]
+        )
+        ch1, ch2 = t.iterate_chords()
+        assert [m.value for m in ch2.midis] == [61, 65]
+        assert ch2.quarter_duration == 2
+        assert ch1._xml_direction_types["below"][0][1][0].XMLClass.__name__ == "XMLFf"
+        assert not ch2._xml_direction_types["below"]
+        assert ch2._xml_lyrics[0].xml_text.value_ == "la"
+
+    def test_add_chord_table_to_part(self):
+        quarter_durations = [1.5, 0.5, 3, 0.25, 0.75, 6]
+        midis = [60, 0, [60, 64], 61, 62, 72]
+        s1 = Score()
+        s1.add_part("p1").add_chord_table(ChordTable(quarter_durations, midis))
+        s2 = Score()
+        p2 = s2.add_part("p1")
+        for qd, m in zip(quarter_durations, midis):
+            p2.add_chord(Chord(m, qd))
+        assert s1.to_string() == s2.to_string()
+
+    def test_add_chord_table_is_placed_like_add_chords(self):
+        quarter_durations = [2.5, 7, 0.5, 9.5, 1.5]
+        midis = [[61, 66], 0, 70.5, 63, 60]
+        dynamics = ["p", None, "ff", None, None]
+        lyrics = ["la", None, None, "lo", None]
+        scores = [Score(), Score()]
+        for score in scores:
+            p = score.add_part("p1")
+            p.add_measure(Time(3, 4))
+            p.add_measure(Time(5, 8))
+        scores[0].get_part(1).add_chords(
+            ChordTable(quarter_durations, midis, dynamics, lyrics).iterate_chords()
+        )
+        scores[1].get_part(1).add_chord_table(
+            ChordTable(quarter_durations, midis, dynamics, lyrics)
+        )
+        assert scores[0].to_string() == scores[1].to_string()
+
+    def test_add_chord_table_creates_chords_when_placed(self):
+        s = Score()
+        p = s.add_part("p1")
+        with patch("musicscore.chord._split_copy") as split_copy:
+            p.add_chord_table(ChordTable([9, 3], [[60, 61], 62]))
+        split_copy.assert_not_called()
+        chords = p.get_chords()
+        assert [ch.quarter_duration for ch in chords] == [4, 4, 1, 3]
+        assert [
+            (ch.all_midis_are_tied_to_previous, ch.all_midis_are_tied_to_next)
+            for ch in chords
+        ] == [(False, True), (True, True), (True, False), (False, False)]
+        assert [m.accidental.show for m in chords[1].midis] == [False, False]
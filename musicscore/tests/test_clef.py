@@ -76,3 +76,19 @@ class TestClef(TestCase):
             if c:
                 assert m.clefs == [c]
         part.finalize()
+
+    def test_clef_lazy_xml_object(self):
+        c = Clef("F", 4)
+        c.number = 2
+        c.octave_change = -1
+        assert c._xml_object is None
+        expected = """<clef number="2">
+  <sign>F</sign>
+  <line>4</line>
+  <clef-octave-change>-1</clef-octave-change>
+</clef>
+"""
+        assert c.to_string() == expected
+        c.line = 3
+        assert c.xml_object.xml_line.value_ == 3
+        assert c.number == 2
@@ -0,0 +1,59 @@
+import json
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from musicscore.chord import Chord
+from musicscore.finalize import FinalizeReport, profile_finalize
+from musicscore.score import Score
+
+
+class TestFinalizeReport(TestCase):
+    def setUp(self):
+        self.score = Score()
+        self.part = self.score.add_part("p1")
+        for _ in range(8):
+            self.part.add_chord(Chord(60, 1))
+
+    def test_no_report_outside_context(self):
+        with profile_finalize() as report:
+            pass
+        self.score.to_string()
+        assert isinstance(report, FinalizeReport)
+        assert report.statistics == {}
+
+    def test_phases_and_node_types(self):
+        with profile_finalize() as report:
+            self.score.to_string()
+        assert report.statistics[("finalize", "Score")]["calls"] == 1
+        assert report.statistics[("finalize", "Part")]["calls"] == 1
+        assert report.statistics[("finalize", "Measure")]["calls"] == 2
+        assert report.statistics[("finalize", "Beat")]["calls"] == 8
+        assert report.statistics[("finalize", "Chord")]["calls"] == 8
+        assert report.statistics[("accidentals", "Measure")]["calls"] == 2
+        assert report.statistics[("serialization", "Score")]["calls"] == 1
+        assert {
+            "quantization",
+            "split_unwritable_chords",
+            "tuplets",
+            "beams",
+            "notes",
+        }.issubset(report.phases)
+        assert set(report.node_types["Measure"]) == {
+            "finalize",
+            "accidentals",
+            "xml_notes",
+        }
+
+    def test_chrome_trace(self):
+        with profile_finalize() as report:
+            self.score.to_string()
+        trace = report.get_chrome_trace()
+        assert len(trace["traceEvents"]) == sum(
+            values["calls"] for values in report.statistics.values()
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "trace.json"
+            report.write_chrome_trace(path)
+            with open(path) as f:
+                assert json.load(f) == trace
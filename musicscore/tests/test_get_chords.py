@@ -143,3 +143,27 @@ class TestGetChords(TestCase):
             4,
             4,
         ]
+
+    def test_get_chords_index_is_updated(self):
+        p1 = self.score.get_part(1)
+        chords = p1.get_chords()
+        assert len(chords) == 7
+        chords.pop()
+        assert len(p1.get_chords()) == 7
+        p1.add_chord(Chord(65, 1))
+        assert len(p1.get_chords()) == 8
+        assert self.score.get_chords() == [
+            ch for p in self.score.get_children() for ch in p.get_chords()
+        ]
+        assert p1.get_chords()[-1].midis[0].value == 65
+        assert p1.get_beats() == [
+            b
+            for m in p1.get_children()
+            for st in m.get_children()
+            for v in st.get_children()
+            for b in v.get_children()
+        ]
+        p1.finalize()
+        assert p1.get_chords() == [
+            ch for beat in p1.get_beats() for ch in beat.get_children()
+        ]
@@ -248,6 +248,19 @@ class TestGetChord(TestCase):
         b = v.add_child(Beat())
         ch = b.add_child(Chord(60, 1))[0]
         assert s.get_chord(1, 1, 1, 1, 1, 1) == ch
+        assert (
+            s.get_chord(
+                chord_number=1,
+                beat_number=1,
+                voice_number=1,
+                staff_number=1,
+                measure_number=1,
+                part_number=1,
+            )
+            == ch
+        )
+        assert s.get_chord(1, 1, 1, 1, 1, 2) is None
+        assert s.get_chord(1, 2, 1, 1, 1, 1) is None
 
     def test_part_get_chord(self):
         p = Part("p1")
@@ -21,3 +21,13 @@ class TestStaff(TestCase):
         assert copied.xml_object != k.xml_object
         assert copied.fifths == k.fifths
         assert copied.show == k.show
+
+    def test_key_lazy_xml_object(self):
+        k = Key(fifths=2)
+        assert k._xml_object is None
+        k.fifths = -1
+        assert k._xml_object is None
+        assert k.xml_object.xml_fifths.value_ == -1
+        k.fifths = 4
+        assert k.xml_object.xml_fifths.value_ == 4
+        assert k.fifths == 4
@@ -5,7 +5,7 @@ from musicscore.lyrics import Lyrics
 from musicscore.part import Part
 from musicscore.tests.util import _generate_xml_lyric
 from musicscore.util import _generate_lyrics
-from musicxml import XMLLyric, XMLText, XMLElision, XMLSyllabic
+from musicxml import XMLLyric, XMLText, XMLElision, XMLSyllabic, XMLEndLine
 from musicxml.exceptions import XMLElementChildrenRequired
 
 test_lyrics_string = [
@@ -533,3 +533,27 @@ class TestTiedChordsWithExtendedLyrics(TestCase):
             self.get_extend_types(self.part.get_chords()),
             ["start", "continue", "stop", None],
         )
+
+    def test_extension_lyrics_keep_attributes(self):
+        chord = Chord(60, 2.5)
+        lyric = chord.add_lyric("one", number="2", default_y=-10)
+        lyric.xml_syllabic = "single"
+        lyric.xml_end_line = XMLEndLine()
+        self.part.add_chord(chord)
+        chords = self.part.get_chords()
+        self.assertEqual(
+            self.get_extend_types(chords),
+            ["start", "stop"],
+        )
+        for extension in [ch.xml_lyrics[0] for ch in chords[1:]]:
+            assert extension.attributes == {"number": "2", "default-y": -10}
+            assert not extension.xml_text
+            assert not extension.xml_syllabic
+            assert extension.xml_end_line
+            assert extension.xml_end_line != lyric.xml_end_line
+        expected = """<lyric number="2" default-y="-10">
+  <extend type="stop" />
+  <end-line />
+</lyric>
+"""
+        assert chords[-1].xml_lyrics[0].to_string() == expected
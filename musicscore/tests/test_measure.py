@@ -49,6 +49,18 @@ class TestMeasure(TestCase):
         m.xml_object.number = "3"
         assert m.number == 3
 
+    def test_lazy_xml_objects(self):
+        p = Part("p1")
+        m1 = p.add_measure()
+        m2 = p.add_measure()
+        for m in [m1, m2]:
+            assert m._xml_object.xml_attributes is None
+            assert m.key._xml_object is None
+            assert m.time._xml_object is None
+            assert m.clefs[0]._xml_object is None
+        assert m2.xml_object.xml_attributes.xml_divisions.value_ == 1
+        assert m2.get_divisions() == 1
+
     def test_measure_time_signature(self):
         m = Measure(1)
         expected = """<time>
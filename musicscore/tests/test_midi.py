@@ -3,9 +3,18 @@ from unittest import TestCase
 from unittest.mock import patch
 
 from musicscore import Chord, Part, Time, Score
-from musicscore.accidental import Accidental
+from musicscore.accidental import (
+    Accidental,
+    STANDARD,
+    ENHARMONIC,
+    FLAT,
+    SHARP,
+    FORCEFLAT,
+    FORCESHARP,
+    SIGNS,
+)
 from musicscore.measure import Measure
-from musicscore.midi import Midi
+from musicscore.midi import Midi, get_accidental_mode
 from musicscore.note import Note
 from musicscore.tests.util import generate_path
 from musicxml.xmlelement.xmlelement import XMLPitch, XMLRest, XMLNotehead
@@ -120,6 +129,24 @@ class TestMidi(TestCase):
 """
         assert m.get_pitch_or_rest().to_string() == expected
 
+    def test_lazy_pitch_and_accidental(self):
+        m = Midi(61)
+        m.value = 63
+        m.accidental.mode = "sharp"
+        assert m._pitch_or_rest is None
+        assert m.accidental._xml_object is None
+        expected = """<pitch>
+  <step>D</step>
+  <alter>1</alter>
+  <octave>4</octave>
+</pitch>
+"""
+        assert m.get_pitch_or_rest().to_string() == expected
+        m.accidental.show = True
+        assert m.accidental.xml_object.value_ == "sharp"
+        m.accidental.mode = "flat"
+        assert m.accidental.xml_object.value_ == "flat"
+
     def test_midi_copy(self):
         m = Midi(61, accidental=Accidental(mode="sharp", show=False))
         m.add_tie("start")
@@ -191,6 +218,42 @@ class TestMidi(TestCase):
         assert midi.get_staff_number() == 2
 
 
+class TestGetAccidentalMode(TestCase):
+    def test_get_accidental_mode(self):
+        tables = [
+            ("standard", STANDARD),
+            ("enharmonic", ENHARMONIC),
+            ("flat", FLAT),
+            ("sharp", SHARP),
+            ("force-flat", FORCEFLAT),
+            ("force-sharp", FORCESHARP),
+        ]
+        for midi_value in [v / 2 for v in range(24, 255)]:
+            for alter, sign in SIGNS.items():
+                expected = next(
+                    (
+                        mode
+                        for mode, table in tables
+                        if table[midi_value % 12][1] == alter
+                    ),
+                    None,
+                )
+                assert get_accidental_mode(midi_value, sign) == expected
+                if expected:
+                    m = Midi(midi_value, accidental=Accidental(mode=expected))
+                    assert m.accidental.get_pitch_parameters()[1] == alter
+
+    def test_get_accidental_mode_abbreviations(self):
+        assert get_accidental_mode(61, "#") == "standard"
+        assert get_accidental_mode(61, "b") == "enharmonic"
+        assert get_accidental_mode(60, "bb") == "force-flat"
+        assert get_accidental_mode(0) == "standard"
+        with self.assertRaises(NotImplementedError):
+            get_accidental_mode(61, "+")
+        with self.assertRaises(ValueError):
+            get_accidental_mode(128)
+
+
 class TestMidiNoteHead(TestCase):
     def test_notehead_property(self):
         m = Midi(60)
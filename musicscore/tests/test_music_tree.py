@@ -224,3 +224,22 @@ class TestMusicTree(TestCase):
 
         with self.assertRaises(ValueError):
             b.get_chord(beat_number=2)
+
+    def test_local_attributes(self):
+        for cls in [Score, Part, Measure, Staff, Voice, Beat, Chord, Note, Midi]:
+            assert cls._LOCAL_ATTRIBUTES == cls._ATTRIBUTES.union(
+                cls._TREE_ATTRIBUTES
+            )
+        m = Measure(1)
+        m.xml_object.width = 100
+        m.width = 200
+        assert m.xml_object.width == 200
+        m.content = "content"
+        assert m.content == "content"
+        assert m.xml_object.attributes.get("content") is None
+        p = Part("p1")
+        ch = Chord([60, 61], 1)
+        p.add_chord(ch)
+        p.finalize()
+        ch.xml_stem = ["up", "down"]
+        assert [n.xml_stem.value_ for n in ch.notes] == ["up", "down"]
@@ -575,6 +575,44 @@ class TestAddChordToPart(TestCase):
         get_xml_diff_part(expected_path, xml_path, Path(__file__))
 
 
+class TestAddChordsToPart(TestCase):
+    @staticmethod
+    def _get_chords():
+        quarter_durations = [0.5, 1.5, 3, 5, 0.25, 0.75, 7, 2, 1, 6]
+        midis = [60, 0, [60, 64], 62, 61, 0, 72, 67, 65, 60]
+        return [Chord(m, qd) for m, qd in zip(midis, quarter_durations)]
+
+    def _get_string(self, bulk):
+        score = Score()
+        part = score.add_part("p1")
+        for staff_number in [1, 2]:
+            chords = self._get_chords()
+            if staff_number == 2:
+                chords[3].add_grace_chord(70)
+            if bulk:
+                part.add_chords(chords, staff_number=staff_number)
+            else:
+                for chord in chords:
+                    part.add_chord(chord, staff_number=staff_number)
+        return score.to_string()
+
+    def test_add_chords_is_identical_to_add_chord(self):
+        assert self._get_string(bulk=True) == self._get_string(bulk=False)
+
+    def test_add_chords_current_measure(self):
+        p = Part("p1")
+        p.add_chords([Chord(60, 4), Chord(60, 6)])
+        m1, m2, m3 = p.get_children()
+        assert p.get_current_measure() == m3
+        p.add_chords(iter([Chord(60, 2)]))
+        assert len(p.get_children()) == 3
+        assert m3.get_voice(staff_number=1, voice_number=1).is_filled
+
+    def test_add_chords_wrong_type(self):
+        with self.assertRaises(TypeError):
+            Part("p1").add_chords([Chord(60, 1), 60])
+
+
 class TestPartIdUniqueness(TestCase):
     def test_part_id_is_unique(self):
         part_a = Part(id="p1")
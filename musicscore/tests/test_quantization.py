@@ -6,6 +6,7 @@ from unittest import TestCase
 from musicscore.beat import Beat
 from musicscore.chord import Chord
 from musicscore.part import Part
+from musicscore.quantize import _resolving_settings
 from musicscore.quarterduration import QuarterDuration
 from musicscore.score import Score
 from musicscore.staff import Staff
@@ -102,6 +103,79 @@ class TestQuantization(TestCase):
         assert st.get_quantized is False
         assert v.get_quantized is True
 
+    def test_inherited_possible_subdivisions_are_copies(self):
+        s = Score()
+        p = s.add_child(Part("p1"))
+        m = p.add_measure()
+        b = m.get_children()[0].get_children()[0].get_children()[0]
+        b.get_possible_subdivisions().append(9)
+        assert s.get_possible_subdivisions() == [2, 3, 4, 5, 6, 7, 8]
+        m.set_possible_subdivisions([2, 4])
+        assert b.get_possible_subdivisions() == [2, 4]
+        assert m.get_possible_subdivisions() is m.get_possible_subdivisions()
+
+    def test_resolved_settings_while_finalizing(self):
+        s = Score()
+        p = s.add_child(Part("p1"))
+        m = p.add_measure()
+        b = m.get_children()[0].get_children()[0].get_children()[0]
+        other_score = Score()
+
+        @_resolving_settings
+        def check(node):
+            assert b.quantization_engine == "exhaustive"
+            assert b.simplified_sextuplets is False
+            p.quantization_engine = "windowed"
+            p.simplified_sextuplets = True
+            assert b.quantization_engine == "windowed"
+            assert b.simplified_sextuplets is True
+            assert s._resolved_settings
+            assert other_score.__dict__.get("_resolved_settings") is None
+
+        check(b)
+        assert s._resolved_settings is None
+        p.quantization_engine = None
+        assert b.quantization_engine == "exhaustive"
+
+    def test_quantization_engine_attribute(self):
+        s = Score()
+        p = s.add_child(Part("p1"))
+        m = p.add_measure()
+        b = m.get_children()[0].get_children()[0].get_children()[0]
+        assert b.quantization_engine == "exhaustive"
+        p.quantization_engine = "windowed"
+        assert b.quantization_engine == "windowed"
+        b.quantization_engine = "exhaustive"
+        assert b.quantization_engine == "exhaustive"
+        assert m.quantization_engine == "windowed"
+        with self.assertRaises(ValueError):
+            s.quantization_engine = "numpy"
+
+    def test_windowed_quantization_engine_is_identical(self):
+        random.seed(5)
+        for beat_quarter_duration in [1, 1 / 2, 3 / 2, 2]:
+            for _ in range(20):
+                cuts = sorted(
+                    QuarterDuration(random.random() * beat_quarter_duration)
+                    for _ in range(random.randint(1, 6))
+                )
+                positions = [0] + cuts + [QuarterDuration(beat_quarter_duration)]
+                quarter_durations = [
+                    positions[i + 1] - positions[i] for i in range(len(cuts) + 1)
+                ]
+                if sum(quarter_durations) != beat_quarter_duration:
+                    continue
+                subdivisions = random.sample(range(2, 17), random.randint(1, 6))
+                results = []
+                for engine in ["exhaustive", "windowed"]:
+                    b = Beat(beat_quarter_duration)
+                    b.set_possible_subdivisions(subdivisions)
+                    b.quantization_engine = engine
+                    results.append(
+                        b._get_quantized_quarter_durations(quarter_durations)
+                    )
+                assert results[0] == results[1]
+
     def test_simple_quantization(self):
         s = Score()
         p = s.add_child(Part("p1"))
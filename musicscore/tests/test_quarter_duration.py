@@ -137,6 +137,16 @@ class TestQuarterDuration(TestCase):
         assert QuarterDuration(0.75).get_number_of_dots() == 1
         assert QuarterDuration(2 + 2 / 2 + 2 / 4).get_number_of_dots() == 2
 
+    def test_type_and_tuplet_cache(self):
+        qd_1 = QuarterDuration(1, 3)
+        qd_2 = QuarterDuration(1, 3)
+        assert qd_1.type_and_dots is qd_2.type_and_dots
+        assert qd_1.get_tuplet_ratio() == (3, 2)
+        qd_1.beat_subdivision = 6
+        assert qd_1.get_tuplet_ratio() == (6, 4)
+        assert qd_2.get_tuplet_ratio() == (3, 2)
+        assert qd_2.beat_subdivision == 3
+
     def test_is_unwritable(self):
         for value in [0.23, 5 / 2, 9 / 2, 5 / 4, 9 / 5]:
             with self.assertRaises(QuarterDurationIsNotWritable):
@@ -312,3 +322,49 @@ class TestMagics(TestCase):
         a = self.cl(3)
         b = self.cl(10)
         assert a.__rfloordiv__(b) == b // a
+
+
+class TestMagicsWithTicks(TestMagics):
+    def setUp(self):
+        QuarterDuration.set_ticks_per_quarter(QuarterDuration.DEFAULT_TICKS_PER_QUARTER)
+        super().setUp()
+
+    def tearDown(self):
+        QuarterDuration.set_ticks_per_quarter(None)
+
+
+class TestTicks(TestCase):
+    def setUp(self):
+        QuarterDuration.set_ticks_per_quarter(QuarterDuration.DEFAULT_TICKS_PER_QUARTER)
+
+    def tearDown(self):
+        QuarterDuration.set_ticks_per_quarter(None)
+
+    def test_ticks(self):
+        assert QuarterDuration(1, 3)._ticks == 3360
+        assert QuarterDuration(1, 11)._ticks is None
+        assert QuarterDuration(1, 11).value == Fraction(1, 11)
+
+    def test_arithmetics_are_identical(self):
+        values = [Fraction(n, d) for d in [1, 2, 3, 5, 7, 8, 11, 16] for n in range(9)]
+        for v1 in values:
+            for v2 in values:
+                q1, q2 = QuarterDuration(v1), QuarterDuration(v2)
+                QuarterDuration.set_ticks_per_quarter(None)
+                f1, f2 = QuarterDuration(v1), QuarterDuration(v2)
+                QuarterDuration.set_ticks_per_quarter(
+                    QuarterDuration.DEFAULT_TICKS_PER_QUARTER
+                )
+                assert (q1 + q2).value == (f1 + f2).value
+                assert (q1 - q2).value == (f1 - f2).value
+                assert (q1 * 3).value == (f1 * 3).value
+                assert (q1 < q2) == (f1 < f2)
+                assert (q1 <= q2) == (f1 <= f2)
+                assert (q1 == q2) == (f1 == f2)
+                assert hash(q1) == hash(f1) == hash(v1)
+
+    def test_set_ticks_per_quarter(self):
+        with self.assertRaises(ValueError):
+            QuarterDuration.set_ticks_per_quarter(0)
+        QuarterDuration.set_ticks_per_quarter(None)
+        assert QuarterDuration(1, 3)._ticks is None
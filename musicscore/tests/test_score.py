@@ -1,12 +1,26 @@
+import gc
+import tempfile
+import tracemalloc
+from pathlib import Path
 from unittest import TestCase, skip
 
 from musicscore.chord import Chord
-from musicscore.exceptions import ScoreHasNoPartsError, ScoreMultiMeasureRestError
+from musicscore.exceptions import (
+    ScoreHasNoPartsError,
+    ScoreMultiMeasureRestError,
+    ScoreXMLReleasedError,
+)
 from musicscore.layout import StaffLayout
 from musicscore.measure import Measure
 from musicscore.part import Part
 from musicscore.score import Score, TITLE, SUBTITLE
+from musicscore.simpleformat import SimpleFormat
+from musicscore.time import Time
 from musicxml import XMLNote
+from musicxml.exceptions import XMLElementChildrenRequired
+from musicxml.xmlelement.xmlelement import XMLCredit
+
+path = Path(__file__)
 
 
 class TestScore(TestCase):
@@ -436,3 +450,130 @@ class TestScore(TestCase):
             assert (
                 p.get_children()[-1].xml_barline.xml_bar_style.value_ == "light-light"
             )
+
+
+class TestExportXML(TestCase):
+    # Each test writes to its own temporary directory, so that tests can run in parallel.
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _get_xml_path(self, name):
+        return Path(self.directory.name) / f"{name}.xml"
+
+    @staticmethod
+    def _create_score():
+        score = Score(title="streamed", get_quantized=True)
+        for part_id in ["p1", "p2"]:
+            part = score.add_part(part_id)
+            sf = SimpleFormat(
+                midis=[60, 61, (62, 66), 0, 63, 70, 71, 72],
+                quarter_durations=[1.2, 0.8, 3, 1.5, 2.5, 1 / 3, 2 / 3, 5],
+            )
+            for chord in sf.chords:
+                part.add_chord(chord)
+        score.set_multi_measure_rest(5, 6)
+        return score
+
+    def test_streamed_export_is_identical(self):
+        xml_path = self._get_xml_path("streamed_export")
+        regular_xml_path = self._get_xml_path("regular_export")
+        self._create_score().export_xml(regular_xml_path)
+        score = self._create_score()
+        score.export_xml(xml_path, stream=True)
+        with open(xml_path) as f1, open(regular_xml_path) as f2:
+            assert f1.read() == f2.read()
+        assert score._finalized
+        for measure in score.get_children()[0].get_children():
+            assert measure.xml_object._et_xml_element is None
+        with self.assertRaises(ScoreXMLReleasedError):
+            score.to_string()
+        with self.assertRaises(ScoreXMLReleasedError):
+            score.export_xml(xml_path)
+
+    def test_streamed_export_of_finalized_part(self):
+        xml_path = self._get_xml_path("streamed_finalized_export")
+        regular_xml_path = self._get_xml_path("regular_finalized_export")
+        for output_path, stream in [(regular_xml_path, False), (xml_path, True)]:
+            score = self._create_score()
+            score.get_children()[0].finalize()
+            score.export_xml(output_path, stream=stream)
+        with open(xml_path) as f1, open(regular_xml_path) as f2:
+            assert f1.read() == f2.read()
+
+    def test_streamed_export_memory(self):
+        xml_path = self._get_xml_path("streamed_export_memory")
+
+        def get_peak_memory(number_of_measures, stream):
+            score = Score()
+            part = score.add_part("p1")
+            part.add_measure(Time(1, 4))
+            part.add_chords([Chord(60 + i % 12, 1) for i in range(number_of_measures)])
+            gc.collect()
+            tracemalloc.start()
+            score.export_xml(xml_path, stream=stream)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            return peak
+
+        regular_peaks = [get_peak_memory(n, False) for n in [10, 40]]
+        streamed_peaks = [get_peak_memory(n, True) for n in [10, 40]]
+        # Only the notes of finalized chords are kept after each measure is written.
+        assert streamed_peaks[1] - streamed_peaks[0] < (
+            regular_peaks[1] - regular_peaks[0]
+        ) / 20
+        assert streamed_peaks[1] < regular_peaks[0]
+
+    def test_parallel_export_is_identical(self):
+        xml_path = self._get_xml_path("parallel_export")
+        regular_xml_path = self._get_xml_path("regular_export")
+        self._create_score().export_xml(regular_xml_path)
+        self._create_score().export_xml(xml_path, workers=2)
+        with open(xml_path) as f1, open(regular_xml_path) as f2:
+            assert f1.read() == f2.read()
+        # A finalized score is exported regularly.
+        score = self._create_score()
+        score.finalize()
+        score.export_xml(xml_path, workers=2)
+        with open(xml_path) as f1, open(regular_xml_path) as f2:
+            assert f1.read() == f2.read()
+
+    def test_stream_and_workers(self):
+        xml_path = self._get_xml_path("parallel_export")
+        with self.assertRaises(ValueError):
+            self._create_score().export_xml(xml_path, stream=True, workers=2)
+
+    def test_validation_modes(self):
+        with self.assertRaises(ValueError):
+            Score(validation="lazy")
+        regular_xml_path = self._get_xml_path("regular_export")
+        self._create_score().export_xml(regular_xml_path)
+        with open(regular_xml_path) as f:
+            expected = f.read()
+        xml_path = self._get_xml_path("validation_export")
+        for validation in ["deferred", "off"]:
+            for kwargs in [{}, {"stream": True}, {"workers": 2}]:
+                score = self._create_score()
+                score.validation = validation
+                score.export_xml(xml_path, **kwargs)
+                with open(xml_path) as f:
+                    assert f.read() == expected
+
+    def test_validation_errors(self):
+        xml_path = self._get_xml_path("validation_export")
+        for validation, kwargs in [
+            ("eager", {}),
+            ("deferred", {}),
+            ("deferred", {"stream": True}),
+        ]:
+            score = self._create_score()
+            score.validation = validation
+            score.xml_object.add_child(XMLCredit(page=1))
+            with self.assertRaises(XMLElementChildrenRequired):
+                score.export_xml(xml_path, **kwargs)
+        score = self._create_score()
+        score.validation = "off"
+        score.xml_object.add_child(XMLCredit(page=1))
+        score.export_xml(xml_path, stream=True)
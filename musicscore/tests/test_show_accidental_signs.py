@@ -3,7 +3,7 @@ from unittest import TestCase
 
 from musicscore import Score, Time, Chord, C
 from musicscore.tests.util import generate_path
-from musicscore.util import _chord_is_in_a_repetition
+from musicscore.util import _get_chords_in_a_repetition
 
 
 # MyXMLTestSuite test_cautionary
@@ -83,14 +83,35 @@ class TestShowAccidentalSigns(TestCase):
         for qd in 3 * [1]:
             p.add_chord(Chord(C(5, "#"), qd))
         s.export_xml(generate_path(inspect.currentframe()))
-        for index, chord in enumerate(p.get_chords()):
-            if index == 0:
-                assert _chord_is_in_a_repetition(chord) is False
-            else:
-                assert _chord_is_in_a_repetition(chord) is True
+        chords = p.get_chords()
+        assert _get_chords_in_a_repetition(chords) == set(chords[1:])
 
         for index, chord in enumerate(p.get_chords()):
             if index == 0:
                 assert chord.midis[0].accidental.show is True
             else:
                 assert chord.midis[0].accidental.show is False
+
+    def test_chords_in_a_repetition_in_one_pass(self):
+        s = Score()
+        p = s.add_part("p1")
+        p.add_measure(Time(4, 4))
+        for midi, qd in [
+            (C(5, "#"), 1.5),
+            (C(5, "#"), 1),
+            (0, 0.5),
+            (C(5, "#"), 1),
+            (C(5, "#"), 0.5),
+            (61, 0.5),
+            (61, 1),
+            (62, 1),
+            (62, 1),
+        ]:
+            p.add_chord(Chord(midi, qd))
+        s.finalize()
+        # Chords tied to previous chords, rests and chords following a rest are no repetitions.
+        for measure, indices in zip(p.get_children(), [{1}, {2, 4}]):
+            chords = measure.get_voice(staff_number=1, voice_number=1).get_chords()
+            assert _get_chords_in_a_repetition(chords) == {
+                chords[index] for index in indices
+            }
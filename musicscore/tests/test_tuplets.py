@@ -9,7 +9,7 @@ from musicscore.part import Part
 from musicscore.score import Score
 from musicscore.staff import Staff
 from musicscore.tests.test_beat import create_voice
-from musicscore.tests.util_subdivisions import (
+from musicscore.profiler.subdivisions import (
     generate_all_quintuplets_manually,
     generate_all_sextuplets_manually,
     generate_all_triplets_manually,
@@ -44,6 +44,12 @@ class TestUtils(TestCase):
         assert isinstance_as_string(C(4), "C")
         assert not isinstance_as_string(C(4), "str")
 
+    def test_mro_names_are_set_on_class_creation(self):
+        assert "MusicTree" in Score._MRO_NAMES
+        assert {"C", "MidiNote", "Midi"}.issubset(C._MRO_NAMES)
+        assert "XMLWrapper" in Score._MRO_NAMES
+        assert "MusicTree" in Chord._MRO_NAMES
+
     def test_diff_xml_no_diff(self):
         path = Path(__file__).parent / "test_util_diff_xml.xml"
         assert diff_xml(path) == []
@@ -0,0 +1,166 @@
+import io
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from musicscore import Chord, Key, Score, Time
+from musicscore.exceptions import XMLImportError
+from musicscore.xmlimport import import_xml, iterate_measures
+
+
+def _create_score():
+    s = Score(title="Title", subtitle="Subtitle")
+    p = s.add_part("p1")
+    p.name = "Piano"
+    p.add_measure(Time(3, 4)).key = Key(fifths=-2)
+    for qd, midis in [(1, 61), (0.5, [60, 64, 67]), (0.5, 0), (2.5, 70)]:
+        p.add_chord(Chord(midis, qd))
+    for qd, midis in [(1 / 3, 62), (1 / 3, 63), (1 / 3, 66), (0.5, 0)]:
+        p.add_chord(Chord(midis, qd))
+    for qd, midis in [(2, 48), (4, [36, 43])]:
+        p.add_chord(Chord(midis, qd), staff_number=2)
+    chord = Chord(72, 3)
+    chord.add_grace_chord([74, 76])
+    p.add_chord(chord, staff_number=1, voice_number=2)
+    p2 = s.add_part("p2")
+    p2.add_measure(Time(3, 4))
+    p2.add_chord(Chord(72, 6))
+    return s
+
+
+class TestXMLImport(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "score.xml"
+        _create_score().export_xml(self.path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        score = import_xml(self.path)
+        assert score.title.value_ == "Title"
+        assert score.subtitle.value_ == "Subtitle"
+        assert [p.id_ for p in score.get_children()] == ["p1", "p2"]
+        assert score.get_children()[0].name == "Piano"
+        output_path = Path(self.directory.name) / "reimported.xml"
+        score.export_xml(output_path)
+        with open(self.path) as f1, open(output_path) as f2:
+            assert f1.read() == f2.read()
+
+    def test_voices_and_staves(self):
+        part = import_xml(self.path).get_children()[0]
+        measure = part.get_children()[0]
+        assert [ch.quarter_duration for ch in measure.get_voice(1, 1).get_chords()] == [
+            1,
+            0.5,
+            0.5,
+            1,
+        ]
+        assert [m.value for m in measure.get_voice(1, 1).get_chords()[1].midis] == [
+            60,
+            64,
+            67,
+        ]
+        assert measure.get_voice(1, 1).get_chords()[3].midis[0].is_tied_to_next
+        assert [m.value for m in measure.get_voice(1, 2).get_chords()[0].midis] == [
+            74,
+            76,
+        ]
+        assert measure.get_voice(1, 2).get_chords()[0].quarter_duration == 0
+        assert measure.get_staff(2).clef.sign == "F"
+        assert measure.key.fifths == -2
+        assert part.get_children()[1].key.show is False
+
+    def test_iterate_measures(self):
+        with open(self.path, "rb") as f:
+            source = io.BytesIO(f.read())
+        measures = []
+        for measure in iterate_measures(source, keep_measures=False):
+            assert measure.up.get_children() == [measure]
+            measures.append((measure.up.id_, measure.number))
+        assert measures == [("p1", 1), ("p1", 2), ("p2", 1), ("p2", 2)]
+
+    def test_iterate_measures_with_irregular_numbers(self):
+        with open(self.path) as f:
+            text = f.read()
+        text = text.replace('<measure number="1"', '<measure number="X1"').replace(
+            '<measure number="2"', '<measure number="1a"'
+        )
+        numbers = [
+            (measure.up.id_, measure.number)
+            for measure in iterate_measures(io.StringIO(text), keep_measures=False)
+        ]
+        assert numbers == [("p1", 1), ("p1", 2), ("p2", 1), ("p2", 2)]
+
+    def test_on_measure(self):
+        def transpose(measure):
+            for chord in measure.get_chords():
+                for midi in chord.midis:
+                    if midi.value:
+                        midi.value += 2
+
+        score = import_xml(self.path, on_measure=transpose)
+        assert [ch.midis[0].value for ch in score.get_children()[1].get_chords()] == [
+            74,
+            74,
+        ]
+
+    def test_import_errors(self):
+        with self.assertRaises(XMLImportError):
+            list(iterate_measures(io.StringIO("<score-timewise />")))
+        overlapping = """<score-partwise>
+  <part id="p1">
+    <measure number="1">
+      <note><rest /><duration>2</duration><voice>1</voice></note>
+      <backup><duration>1</duration></backup>
+      <note><rest /><duration>3</duration><voice>1</voice></note>
+    </measure>
+  </part>
+</score-partwise>"""
+        with self.assertRaises(XMLImportError):
+            import_xml(io.StringIO(overlapping))
+
+    def test_accidentals(self):
+        xml = """<score-partwise>
+  <part id="p1">
+    <measure number="1">
+      <attributes><divisions>1</divisions><time><beats>3</beats><beat-type>4</beat-type></time></attributes>
+      <note><pitch><step>F</step><alter>1</alter><octave>4</octave></pitch><duration>1</duration></note>
+      <note><pitch><step>F</step><octave>4</octave></pitch><duration>1</duration>
+        <accidental cautionary="yes">natural</accidental></note>
+      <note><pitch><step>B</step><alter>-1</alter><octave>4</octave></pitch><duration>1</duration>
+        <accidental>flat</accidental></note>
+    </measure>
+  </part>
+</score-partwise>"""
+        score = import_xml(io.StringIO(xml))
+        midis = [ch.midis[0] for ch in score.get_children()[0].get_chords()]
+        assert [m.accidental.show for m in midis] == [False, True, True]
+        assert midis[1].accidental.cautionary == "yes"
+        score.finalize()
+        assert [
+            (
+                m.parent_note.xml_object.xml_accidental.value_
+                if m.parent_note.xml_object.xml_accidental
+                else None
+            )
+            for m in midis
+        ] == [None, "natural", "flat"]
+
+    def test_attributes_in_the_middle_of_a_measure(self):
+        xml = """<score-partwise>
+  <part id="p1">
+    <measure number="1">
+      <attributes><divisions>1</divisions><clef><sign>G</sign><line>2</line></clef></attributes>
+      <note><rest /><duration>2</duration><voice>1</voice></note>
+      <backup><duration>2</duration></backup>
+      <attributes><clef><sign>F</sign><line>4</line></clef></attributes>
+      <note><rest /><duration>2</duration><voice>2</voice></note>
+      <attributes><clef><sign>C</sign><line>3</line></clef></attributes>
+    </measure>
+  </part>
+</score-partwise>"""
+        with self.assertRaises(XMLImportError) as context:
+            import_xml(io.StringIO(xml))
+        assert "Measure 1: attributes" in str(context.exception)
@@ -1,5 +1,5 @@
 from musicscore.tests.test_metronome import TestCase
-from musicscore.tests.util_subdivisions import (
+from musicscore.profiler.subdivisions import (
     generate_all_subdivisions,
     subdivision_patterns_generator,
     get_first_pattern,
@@ -54,7 +54,7 @@ class Time(XMLWrapper):
 
     def __init__(self, *signatures, show=True, **kwargs):
         super().__init__()
-        self._xml_object = self.XMLClass(**kwargs)
+        self._xml_object = self.XMLClass(**kwargs) if kwargs else None
         self._parent_measure = None
 
         self._signatures = None
@@ -88,7 +88,13 @@ class Time(XMLWrapper):
         self._actual_signatures = None
         self._intern_actual_signatures = None
 
+    def _create_xml_object(self):
+        self._xml_object = self.XMLClass()
+        self._update_signature_objects()
+
     def _update_signature_objects(self):
+        if self._xml_object is None:
+            return
         signatures = [
             self.signatures[i : i + 2] for i in range(0, len(self.signatures), 2)
         ]
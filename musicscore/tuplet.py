@@ -1,6 +1,7 @@
 from typing import Any, Optional
 
 from musicscore.exceptions import TupletNormalTypeError
+from musicscore.quantize import _clear_resolved_settings, _get_resolved_setting
 from musicxml import XMLTimeModification, XMLTuplet
 
 TUPLETACTUALTONORMALNOTES = {
@@ -162,7 +163,7 @@ class SimplifiedSextuplets:
     def simplified_sextuplets(self) -> bool:
         if self._simplified_sextuplets is None:
             if self.up:
-                return self.up.simplified_sextuplets
+                return _get_resolved_setting(self.up, "simplified_sextuplets")
             else:
                 return False
         return self._simplified_sextuplets
@@ -170,3 +171,4 @@ class SimplifiedSextuplets:
     @simplified_sextuplets.setter
     def simplified_sextuplets(self, value: bool) -> None:
         self._simplified_sextuplets = value
+        _clear_resolved_settings(self)
@@ -234,27 +234,51 @@ def isinstance_as_string(
     :param str/[str] parent_class_names:
     :return: bool
     """
+    class_names = getattr(child.__class__, "_MRO_NAMES", None)
+    if class_names is None:
+        class_names = _get_mro_names(child.__class__)
     if isinstance(parent_class_names, str):
-        parent_class_names = [parent_class_names]
+        return parent_class_names in class_names
 
     for parent_class_name in parent_class_names:
-        if parent_class_name not in [cls.__name__ for cls in child.__class__.__mro__]:
+        if parent_class_name not in class_names:
             return False
     return True
 
 
-def _chord_is_in_a_repetition(chord):
-    my_index = chord.up.up.get_chords().index(chord)
-    if my_index > 0 and not chord.is_tied_to_previous:
-        all_previous_chords = [
-            chord.up.up.get_chords()[my_index - i] for i in range(1, my_index + 1)
-        ]
-        if set([ch.is_tied_to_previous for ch in all_previous_chords]) == {True}:
-            return False
-        previous_chord = all_previous_chords[0]
-        if not previous_chord.is_rest and chord.has_same_pitches(previous_chord):
-            return True
-    return False
+def _get_mro_names(cls):
+    # Names of all classes in the __mro__ of cls. MusicTree and XMLWrapper classes store them as _MRO_NAMES when they are created (see
+    # their __init_subclass__), so that isinstance_as_string does not have to build them on each call.
+    return frozenset(c.__name__ for c in cls.__mro__)
+
+
+def _get_local_attributes(cls):
+    # Attributes which are set on an instance of cls itself and are not forwarded by __setattr__ (see XMLWrapper and Chord).
+    return frozenset(cls._ATTRIBUTES).union(getattr(cls, "_TREE_ATTRIBUTES", ()))
+
+
+def _get_chords_in_a_repetition(chords):
+    # Chords of a voice which repeat the pitches of their previous chord without being tied to it. A chord following a rest or following only
+    # chords which are tied to their previous chords is no repetition. Computed in one forward pass.
+    output = set()
+    previous_chord = None
+    all_previous_chords_are_tied = True
+    for chord in chords:
+        is_tied_to_previous = chord.is_tied_to_previous
+        if (
+            previous_chord is not None
+            and not is_tied_to_previous
+            and not all_previous_chords_are_tied
+            and not chord.is_rest
+            and not previous_chord.is_rest
+            and chord.has_same_pitches(previous_chord)
+        ):
+            output.add(chord)
+        all_previous_chords_are_tied = (
+            all_previous_chords_are_tied and is_tied_to_previous
+        )
+        previous_chord = chord
+    return output
 
 
 def slur_chords(chords, number=1, **kwargs):
@@ -0,0 +1,336 @@
+"""
+Reads MusicXML files (``score-partwise``) into the musicscore tree. The file is parsed incrementally with
+:obj:`xml.etree.ElementTree.iterparse`: each ``<measure>`` is turned into a :obj:`~musicscore.measure.Measure` as soon as it has been
+read, and its xml elements are released afterwards, so that large files never have to be held in memory as a whole.
+
+The following is read:
+
+- part ids and names (``<part-list>``), title and subtitle credits (or ``<movement-title>`` / ``<work-title>`` as title)
+- divisions, key (fifths), time signatures, staves and clefs of ``<attributes>``
+- notes, rests, chords (``<chord/>``), ties and grace notes with their ``<voice>`` and ``<staff>``. ``<backup>`` and ``<forward>`` are
+  used to compute the position of each note. Gaps in a voice are filled with rests.
+- accidentals: a pitch is shown with an accidental sign only if its note has an ``<accidental>`` element (see
+  :obj:`~musicscore.accidental.Accidental.show`). Its ``cautionary``, ``editorial``, ``parentheses`` and ``bracket`` attributes are
+  kept.
+
+Each source voice is mapped onto a :obj:`~musicscore.voice.Voice` of its :obj:`~musicscore.staff.Staff`. Voices of a staff are numbered
+in order of their first appearance in the part. Voices whose notes change staff within a measure (cross-staff notation) are not
+supported: their notes are split by staff and usually raise an :obj:`~musicscore.exceptions.XMLImportError` because they overlap or
+leave gaps. ``<attributes>`` are only read at the beginning of a measure: a clef or time change in the middle or at the end of a
+measure raises an :obj:`~musicscore.exceptions.XMLImportError`. Directions, notations, lyrics and barlines are not read. Incomplete
+measures (e.g. pickup measures) are filled with rests. Measure numbers which are not positive integers (e.g. ``"12a"`` or ``"X1"``)
+are replaced by the number of the previous measure of the part plus one.
+
+Usage::
+
+    score = import_xml("input.xml")
+
+    for measure in iterate_measures("large.xml", keep_measures=False):
+        for chord in measure.get_chords():
+            ...
+"""
+
+import xml.etree.ElementTree as ET
+from fractions import Fraction
+from typing import Callable, Iterator, Optional
+
+from musicscore.accidental import Accidental, SIGNS
+from musicscore.chord import Chord, GraceChord
+from musicscore.clef import Clef
+from musicscore.exceptions import XMLImportError
+from musicscore.key import Key
+from musicscore.measure import Measure
+from musicscore.midi import Midi, get_accidental_mode
+from musicscore.quarterduration import QuarterDuration
+from musicscore.score import Score
+from musicscore.time import Time
+
+__all__ = ["iterate_measures", "import_xml"]
+
+_STEPS = {"C": 0, "D": 2, "E": 4, "F": 5, "G": 7, "A": 9, "B": 11}
+
+# Attributes of <accidental> which are kept. The sign itself is computed from the pitch.
+_ACCIDENTAL_ATTRIBUTES = ("cautionary", "editorial", "parentheses", "bracket")
+
+# Children of score-partwise which are released after being read.
+_HEADER_TAGS = {
+    "work",
+    "movement-number",
+    "movement-title",
+    "identification",
+    "defaults",
+    "credit",
+    "part-list",
+}
+
+
+def _get_number(text):
+    number = float(text)
+    return int(number) if number.is_integer() else number
+
+
+def _get_midi(note_element):
+    if note_element.find("rest") is not None:
+        midi = Midi(0)
+    else:
+        pitch = note_element.find("pitch")
+        if pitch is not None:
+            step, octave = pitch.findtext("step"), pitch.findtext("octave")
+            alter = _get_number(pitch.findtext("alter", "0"))
+        else:
+            unpitched = note_element.find("unpitched")
+            step = unpitched.findtext("display-step", "B")
+            octave = unpitched.findtext("display-octave", "4")
+            alter = 0
+        value = (int(octave) + 1) * 12 + _STEPS[step] + alter
+        mode = get_accidental_mode(value, SIGNS.get(alter)) or "standard"
+        accidental_element = note_element.find("accidental")
+        if accidental_element is None:
+            accidental = Accidental(mode=mode, show=False)
+        else:
+            accidental = Accidental(
+                mode=mode,
+                show=True,
+                **{
+                    name: accidental_element.get(name)
+                    for name in _ACCIDENTAL_ATTRIBUTES
+                    if accidental_element.get(name) is not None
+                },
+            )
+        midi = Midi(value, accidental=accidental)
+    for tie in note_element.findall("tie"):
+        midi.add_tie(tie.get("type"))
+    return midi
+
+
+def _get_time(time_element):
+    if time_element.find("beats") is None:
+        # senza-misura
+        return None
+    signatures = []
+    for beats, beat_type in zip(
+        time_element.findall("beats"), time_element.findall("beat-type")
+    ):
+        signatures.extend(
+            [sum(int(b) for b in beats.text.split("+")), int(beat_type.text)]
+        )
+    return Time(*signatures)
+
+
+def _get_clef(clef_element):
+    line = clef_element.findtext("line")
+    octave_change = clef_element.findtext("clef-octave-change")
+    return Clef(
+        sign=clef_element.findtext("sign"),
+        line=int(line) if line is not None else None,
+        octave_change=int(octave_change) if octave_change is not None else None,
+    )
+
+
+class _PartReader:
+    # Keeps the state of one part which is needed to read its measures: divisions, last measure, last measure number and the numbers
+    # of its voices. Measure numbers are counted here since previous measures are removed if measures are not kept.
+    def __init__(self, part):
+        self.part = part
+        self.divisions = 1
+        self.voice_numbers = {}
+        self.last_measure = None
+        self.measure_number = 0
+
+    def _get_voice_number(self, staff_number, voice):
+        staff_voices = self.voice_numbers.setdefault(staff_number, {})
+        if voice not in staff_voices:
+            staff_voices[voice] = len(staff_voices) + 1
+        return staff_voices[voice]
+
+    def _read_attributes(self, attributes_element, attributes):
+        divisions = attributes_element.findtext("divisions")
+        if divisions is not None:
+            self.divisions = int(divisions)
+        fifths = attributes_element.findtext("key/fifths")
+        if fifths is not None:
+            attributes["key"] = Key(fifths=int(fifths))
+        time_element = attributes_element.find("time")
+        if time_element is not None:
+            attributes["time"] = _get_time(time_element)
+        staves = attributes_element.findtext("staves")
+        if staves is not None:
+            attributes["staves"] = int(staves)
+        for clef_element in attributes_element.findall("clef"):
+            attributes["clefs"][int(clef_element.get("number", 1))] = _get_clef(
+                clef_element
+            )
+
+    def _read_voices(self, measure_element):
+        # Returns attributes of measure and a dictionary of (staff number, voice number) and a list of (position, duration, chord)
+        # tuples. Positions and durations are in divisions.
+        attributes = {"clefs": {}}
+        voices = {}
+        position = 0
+        last_chord = None
+        for element in measure_element:
+            if element.tag == "attributes":
+                if position > 0:
+                    raise XMLImportError(
+                        f"Measure {measure_element.get('number')}: attributes in the middle or at the end of a measure are not "
+                        "supported."
+                    )
+                self._read_attributes(element, attributes)
+            elif element.tag == "backup":
+                position -= int(element.findtext("duration"))
+            elif element.tag == "forward":
+                position += int(element.findtext("duration"))
+            elif element.tag == "note":
+                midi = _get_midi(element)
+                if element.find("chord") is not None and last_chord is not None:
+                    last_chord.add_midi(midi)
+                    continue
+                staff_number = int(element.findtext("staff", "1"))
+                voice_number = self._get_voice_number(
+                    staff_number, element.findtext("voice", "1")
+                )
+                if element.find("grace") is not None:
+                    last_chord = GraceChord(midi, type=element.findtext("type"))
+                    duration = 0
+                else:
+                    duration = int(element.findtext("duration"))
+                    last_chord = Chord(
+                        midi, QuarterDuration(Fraction(duration, self.divisions))
+                    )
+                voices.setdefault((staff_number, voice_number), []).append(
+                    (position, duration, last_chord)
+                )
+                position += duration
+        return attributes, voices
+
+    def _add_chords(self, measure, staff_number, voice_number, chords):
+        voice = measure.add_voice(staff_number=staff_number, voice_number=voice_number)
+        filled = 0
+        for position, duration, chord in chords:
+            if position > filled:
+                rest = Chord(
+                    0, QuarterDuration(Fraction(position - filled, self.divisions))
+                )
+                measure._add_chord(
+                    rest, staff_number=staff_number, voice_number=voice_number
+                )
+            elif position < filled:
+                raise XMLImportError(
+                    f"Measure {measure.number}: notes of staff {staff_number} voice {voice_number} overlap."
+                )
+            if isinstance(chord, GraceChord) and voice.is_filled:
+                chord.position = "after"
+            measure._add_chord(
+                chord, staff_number=staff_number, voice_number=voice_number
+            )
+            filled = position + duration
+        if voice.leftover_chord:
+            raise XMLImportError(
+                f"Measure {measure.number}: staff {staff_number} voice {voice_number} exceeds the measure."
+            )
+
+    def read_measure(self, measure_element):
+        attributes, voices = self._read_voices(measure_element)
+        number = measure_element.get("number", "")
+        if number.isdigit() and int(number) > 0:
+            self.measure_number = int(number)
+        else:
+            self.measure_number += 1
+        measure = self.part.add_measure(
+            time=attributes.get("time"), number=self.measure_number
+        )
+        if "key" in attributes:
+            measure.key = attributes["key"]
+        staff_numbers = [staff_number for staff_number, _ in voices]
+        staff_numbers.extend(attributes["clefs"])
+        staff_numbers.append(attributes.get("staves", 1))
+        measure.add_staff(max(staff_numbers))
+        for staff_number, clef in attributes["clefs"].items():
+            measure.get_staff(staff_number).clef = clef
+        for (staff_number, voice_number), chords in voices.items():
+            self._add_chords(measure, staff_number, voice_number, chords)
+        measure.fill_with_rests()
+        return measure
+
+
+def iterate_measures(
+    source: "pathlib.Path", score: Optional[Score] = None, keep_measures: bool = True
+) -> Iterator[Measure]:
+    """
+    Reads a MusicXML file measure by measure (see :obj:`musicscore.xmlimport`).
+
+    :param source: path or file object of a ``score-partwise`` MusicXML file
+    :param score: :obj:`~musicscore.score.Score` to which parts are added. If ``None`` a new score is created. It can be accessed via
+                  the parent of each yielded measure's parent part.
+    :param keep_measures: If ``False`` each measure is removed from its part as soon as the next measure of the part has been read, so
+                          that memory usage does not grow with the length of the file.
+    :return: generator of :obj:`~musicscore.measure.Measure` objects in order of the file, each already added to its
+             :obj:`~musicscore.part.Part`
+    :exception: :obj:`~musicscore.exceptions.XMLImportError`
+    """
+    if score is None:
+        score = Score()
+    part_names = {}
+    root = None
+    part_element = None
+    part_reader = None
+    for event, element in ET.iterparse(source, events=("start", "end")):
+        if root is None:
+            root = element
+            if root.tag != "score-partwise":
+                raise XMLImportError(f"{root.tag} is not supported.")
+            continue
+        tag = element.tag
+        if event == "start":
+            if tag == "part" and part_element is None:
+                part_element = element
+                part = score.add_part(element.get("id"))
+                if part_names.get(part.id_):
+                    part.name = part_names[part.id_]
+                part_reader = _PartReader(part)
+            continue
+        if tag == "measure" and part_reader:
+            previous_measure = part_reader.last_measure
+            measure = part_reader.read_measure(element)
+            part_reader.last_measure = measure
+            if not keep_measures and previous_measure:
+                part_reader.part.remove(previous_measure)
+            part_element.remove(element)
+            yield measure
+        elif tag == "part" and element is part_element:
+            root.remove(element)
+            part_element = None
+            part_reader = None
+        elif tag == "score-part":
+            part_names[element.get("id")] = element.findtext("part-name")
+        elif tag == "credit":
+            credit_type = element.findtext("credit-type")
+            if credit_type in ["title", "subtitle"]:
+                setattr(score, credit_type, element.findtext("credit-words"))
+        elif tag in ["movement-title", "work-title"] and score.title is None:
+            score.title = element.text
+        if tag in _HEADER_TAGS and element in root:
+            root.remove(element)
+
+
+def import_xml(
+    source: "pathlib.Path",
+    score: Optional[Score] = None,
+    on_measure: Optional[Callable[[Measure], None]] = None,
+) -> Score:
+    """
+    Reads a MusicXML file into a :obj:`~musicscore.score.Score` (see :obj:`musicscore.xmlimport`).
+
+    :param source: path or file object of a ``score-partwise`` MusicXML file
+    :param score: :obj:`~musicscore.score.Score` to which parts are added. If ``None`` a new score is created.
+    :param on_measure: function which is called with each :obj:`~musicscore.measure.Measure` as soon as it is read, for example to
+                       transpose its chords.
+    :return: score
+    :exception: :obj:`~musicscore.exceptions.XMLImportError`
+    """
+    if score is None:
+        score = Score()
+    for measure in iterate_measures(source, score):
+        if on_measure:
+            on_measure(measure)
+    return score
@@ -1,15 +1,27 @@
+from musicscore.util import _get_local_attributes, _get_mro_names
+
+
 class XMLWrapper:
     """
     XMLWrapper contains an xml object at its core. It is the place where all the intuitive stuff is translated to attributes and children of
     xml objects.
 
     All attributes and properties which are not listed in _ATTRIBUTES will be set to or get from core xml object.
+
+    A wrapper can postpone the creation of its xml object by setting ``_xml_object`` to ``None`` and overriding :obj:`_create_xml_object`.
+    The xml object will then be created as soon as it is needed for the first time.
     """
 
     _ATTRIBUTES = {}
+    _LOCAL_ATTRIBUTES = frozenset()
 
     XMLClass = None
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._LOCAL_ATTRIBUTES = _get_local_attributes(cls)
+        cls._MRO_NAMES = _get_mro_names(cls)
+
     @property
     def xml_object(self) -> "XMLElement":
         """
@@ -22,7 +34,18 @@ class XMLWrapper:
 
         :return: wrapped MusicXML element of type :obj:`~XMLClass`
         """
-        return self._xml_object
+        return self._get_xml_object()
+
+    def _create_xml_object(self) -> None:
+        # Wrappers with lazy xml objects set self._xml_object here and transfer their state to it.
+        pass
+
+    def _get_xml_object(self):
+        xml_object = self._xml_object
+        if xml_object is None:
+            self._create_xml_object()
+            xml_object = self._xml_object
+        return xml_object
 
     def to_string(self, *args, **kwargs) -> str:
         """
@@ -38,30 +61,22 @@ class XMLWrapper:
             raise ValueError(f"{self.__class__.__name__} has no xml object.")
 
     def __setattr__(self, key, value):
-        attributes = self._ATTRIBUTES
-        try:
-            if self._TREE_ATTRIBUTES:
-                attributes.union(self._TREE_ATTRIBUTES)
-        except AttributeError:
-            pass
-        if key[0] != "_" and (
-            "_xml_object" in self.__dict__
-            and key not in attributes
+        if (
+            key[0] != "_"
+            and key not in self._LOCAL_ATTRIBUTES
+            and "_xml_object" in self.__dict__
             and key not in self.__dict__
         ):
-            setattr(self._xml_object, key, value)
+            setattr(self._get_xml_object(), key, value)
         else:
             super().__setattr__(key, value)
 
     def __getattr__(self, item):
-        if item == "_TREE_ATTRIBUTES":
-            raise AttributeError
+        if item in ("_TREE_ATTRIBUTES", "_xml_object"):
+            raise AttributeError(item)
         if item == "xml_object":
             return super().__getattribute__(item)
         try:
-            return self._xml_object.__getattribute__(item)
+            return getattr(self._get_xml_object(), item)
         except AttributeError:
-            try:
-                return self._xml_object.__getattr__(item)
-            except AttributeError:
-                return super().__getattribute__(item)
+            return super().__getattribute__(item)